@@ -26,7 +26,7 @@ from apps.categories.api.serializers import (
     CategorySerializerGet,
     CategorySerializerPost,
 )
-from apps.users.permisionsUsers import ProductRolePermission
+from apps.users.permissions import ProductRolePermission
 
 
 @extend_schema_view(
@@ -20,7 +20,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiResp
 
 from apps.ingredients.models import Ingredient
 from apps.ingredients.api.serializers import IngredientSerializer
-from apps.users.permisionsUsers import ProductRolePermission
+from apps.users.permissions import ProductRolePermission
 
 
 @extend_schema_view(
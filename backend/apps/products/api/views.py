@@ -30,7 +30,7 @@ from apps.products.api.serializer import (
     ProductOptionSerializer,
     ProductOptionChoiceSerializer,
 )
-from apps.users.permisionsUsers import ProductRolePermission
+from apps.users.permissions import ProductRolePermission
 
 
 @extend_schema_view(
@@ -4,577 +4,767 @@ Management command to load the complete Equus menu (carta) into the database.
 This command creates all categories, ingredients, and products for the restaurant menu
 with bilingual support (Spanish and English).
 
+Everything runs in a single transaction, so a failed load leaves the database
+untouched.
+
 Usage:
     python manage.py load_carta
+    python manage.py load_carta --dry-run --profile
+    python manage.py load_carta --batch-size 50
+    python manage.py load_carta --use-copy      # PostgreSQL only
 """
 
+import cProfile
+import csv
+import io
+import os
+import pstats
 from decimal import Decimal
-from django.core.management.base import BaseCommand
+from types import MappingProxyType
+from typing import NamedTuple
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
 from apps.categories.models import Category
 from apps.ingredients.models import Ingredient
 from apps.products.models import Product
 
+# Concrete parler translation models, resolved once at import time
+CategoryTranslation = Category._parler_meta.root_model
+IngredientTranslation = Ingredient._parler_meta.root_model
+ProductTranslation = Product._parler_meta.root_model
+
+# Default rows per INSERT for every bulk_create (override with --batch-size).
+# Keeps each statement well below the PostgreSQL parameter limit (65,535);
+# lower it when loading into SQLite, which only allows ~999 host parameters
+# per statement by default.
+BULK_BATCH_SIZE = int(os.environ.get('LOAD_CARTA_BATCH_SIZE', 200))
+
+# Products between progress lines; per-row output dominates large loads.
+PROGRESS_EVERY = 100
+
+
+class IngDef(NamedTuple):
+    """Definition of a menu ingredient and its translations."""
+
+    es: str
+    en: str
+    icon: str
+    extra: bool
+    price: Decimal
+
+
+INGREDIENTS = (
+    # Básicos comunes
+    IngDef('Mayonesa', 'Mayonnaise', '🥄', False, Decimal('0.00')),
+    IngDef('Lechuga', 'Lettuce', '🥬', False, Decimal('0.00')),
+    IngDef('Tomate', 'Tomato', '🍅', False, Decimal('0.00')),
+    IngDef('Cebolla', 'Onion', '🧅', False, Decimal('0.00')),
+
+    # Para Picar
+    IngDef('Salsa de yogurt', 'Yogurt sauce', '🥛', False, Decimal('0.00')),
+    IngDef('Salsa barbacoa', 'BBQ sauce', '🍖', False, Decimal('0.00')),
+    IngDef('Alioli', 'Aioli', '🧄', False, Decimal('0.00')),
+    IngDef('Carne de kebab', 'Kebab meat', '🥙', False, Decimal('0.00')),
+    IngDef('Queso gratinado', 'Gratin cheese', '🧀', False, Decimal('0.00')),
+    IngDef('Queso', 'Cheese', '🧀', True, Decimal('0.50')),
+    IngDef('Salsa brava', 'Spicy sauce', '🌶️', False, Decimal('0.00')),
+    IngDef('Salsa carbonara', 'Carbonara sauce', '🥓', False, Decimal('0.00')),
+    IngDef('Bacon', 'Bacon', '🥓', True, Decimal('0.50')),
+    IngDef('Huevo a la plancha', 'Fried egg', '🍳', False, Decimal('0.00')),
+    IngDef('Nachos de maíz', 'Corn nachos', '🌽', False, Decimal('0.00')),
+    IngDef('Salsa cheddar', 'Cheddar sauce', '🧀', False, Decimal('0.00')),
+
+    # Ensaladas
+    IngDef('Tomate cherry', 'Cherry tomato', '🍅', False, Decimal('0.00')),
+    IngDef('Queso de cabra', 'Goat cheese', '🧀', True, Decimal('0.50')),
+    IngDef('Pipas de girasol', 'Sunflower seeds', '🌻', False, Decimal('0.00')),
+    IngDef('Pipas de calabaza', 'Pumpkin seeds', '🎃', False, Decimal('0.00')),
+    IngDef('Aceitunas negras', 'Black olives', '🫒', False, Decimal('0.00')),
+    IngDef('Vinagreta de arándanos', 'Cranberry vinaigrette', '🫐', False, Decimal('0.00')),
+    IngDef('Pollo a la plancha', 'Grilled chicken', '🍗', False, Decimal('0.00')),
+    IngDef('Queso parmesano', 'Parmesan cheese', '🧀', False, Decimal('0.00')),
+    IngDef('Picatostes', 'Croutons', '🍞', False, Decimal('0.00')),
+    IngDef('Salsa césar', 'Caesar dressing', '🥗', False, Decimal('0.00')),
+    IngDef('Queso fresco de cabra', 'Fresh goat cheese', '🧀', False, Decimal('0.00')),
+    IngDef('Nueces', 'Walnuts', '🌰', False, Decimal('0.00')),
+    IngDef('Salsa pesto', 'Pesto sauce', '🌿', False, Decimal('0.00')),
+    IngDef('Helado de limón', 'Lemon ice cream', '🍋', False, Decimal('0.00')),
+
+    # Bocadillos y sandwiches
+    IngDef('Atún', 'Tuna', '🐟', False, Decimal('0.00')),
+    IngDef('Salsa rosa', 'Pink sauce', '🥄', False, Decimal('0.00')),
+    IngDef('Jamón serrano', 'Serrano ham', '🥓', True, Decimal('0.50')),
+    IngDef('Rodajas de tomate', 'Tomato slices', '🍅', False, Decimal('0.00')),
+    IngDef('Aceite', 'Oil', '🫒', False, Decimal('0.00')),
+    IngDef('Filete de pollo', 'Chicken fillet', '🍗', False, Decimal('0.00')),
+    IngDef('Cinta de lomo', 'Pork loin', '🥩', False, Decimal('0.00')),
+    IngDef('Tomate frito', 'Fried tomato', '🍅', False, Decimal('0.00')),
+    IngDef('Albahaca', 'Basil', '🌿', False, Decimal('0.00')),
+    IngDef('Orégano', 'Oregano', '🌿', False, Decimal('0.00')),
+    IngDef('Salchicha', 'Sausage', '🌭', False, Decimal('0.00')),
+    IngDef('Cebolla frita', 'Fried onion', '🧅', False, Decimal('0.00')),
+    IngDef('Mostaza', 'Mustard', '🌭', False, Decimal('0.00')),
+    IngDef('Ketchup', 'Ketchup', '🍅', False, Decimal('0.00')),
+    IngDef('Patatas paja', 'Shoestring fries', '🍟', False, Decimal('0.00')),
+    IngDef('Jamón york', 'York ham', '🥓', True, Decimal('0.50')),
+
+    # Hamburguesas
+    IngDef('Hamburguesa de pollo', 'Chicken patty', '🍗', False, Decimal('0.00')),
+    IngDef('Hamburguesa de cerdo', 'Pork patty', '🥩', False, Decimal('0.00')),
+    IngDef('Hamburguesa vegana', 'Vegan patty', '🥬', False, Decimal('0.00')),
+    IngDef('Hamburguesa de ternera', 'Beef patty', '🥩', False, Decimal('0.00')),
+    IngDef('BBQ', 'BBQ sauce', '🍖', False, Decimal('0.00')),
+    IngDef('Bacon con huevo', 'Bacon with egg', '🥓', False, Decimal('0.00')),
+    IngDef('Cebolla crujiente', 'Crispy onion', '🧅', False, Decimal('0.00')),
+    IngDef('Inyección de queso cheddar', 'Cheddar cheese injection', '🧀', False, Decimal('0.00')),
+    IngDef('Cheddar', 'Cheddar', '🧀', True, Decimal('0.50')),
+
+    # Montaditos
+    IngDef('Lomo adobado', 'Marinated pork loin', '🥩', False, Decimal('0.00')),
+
+    # Camperos
+    IngDef('Mixto', 'Mixed', '🥪', False, Decimal('0.00')),
+    IngDef('Pollo asado', 'Roasted chicken', '🍗', False, Decimal('0.00')),
+    IngDef('Huevo', 'Egg', '🥚', True, Decimal('0.50')),
+
+    # Serranitos
+    IngDef('Pimiento', 'Pepper', '🫑', False, Decimal('0.00')),
+    IngDef('Pimiento frito', 'Fried pepper', '🫑', True, Decimal('0.50')),
+
+    # Combinado
+    IngDef('Torta de trigo', 'Wheat tortilla', '🌯', False, Decimal('0.00')),
+    IngDef('Patatas fritas', 'French fries', '🍟', False, Decimal('0.00')),
+
+    # Extras adicionales mencionados
+    IngDef('Pan sin gluten', 'Gluten-free bread', '🍞', True, Decimal('0.50')),
+)
+
+
+# Every product of the carta. Entries are read-only and ``category_idx``
+# points into ``Command.create_categories``' list.
+PRODUCTS_DATA = (
+    # PARA PICAR
+    MappingProxyType({
+        'category_idx': 0,
+        'es_name': 'Patatas Fritas',
+        'en_name': 'French Fries',
+        'es_desc': 'Crujientes patatas fritas doradas, perfectas para acompañar o disfrutar solas',
+        'en_desc': 'Crispy golden french fries, perfect to share or enjoy alone',
+        'price': Decimal('4.00'),
+        'ingredients': ()
+    }),
+    MappingProxyType({
+        'category_idx': 0,
+        'es_name': 'Patatas Gratinadas',
+        'en_name': 'Gratin Fries',
+        'es_desc': 'Crujientes patatas fritas con tu elección de salsa (yogurt, barbacoa o alioli), jugosa carne de kebab y generosa capa de queso gratinado',
+        'en_desc': 'Crispy fries with your choice of sauce (yogurt, BBQ or aioli), juicy kebab meat and generous layer of gratin cheese',
+        'price': Decimal('5.00'),
+        'ingredients': ('Salsa de yogurt', 'Salsa barbacoa', 'Alioli', 'Carne de kebab', 'Queso gratinado')
+    }),
+    MappingProxyType({
+        'category_idx': 0,
+        'es_name': 'Patatas Bravas',
+        'en_name': 'Patatas Bravas',
+        'es_desc': 'Patatas fritas bañadas en alioli cremoso, queso fundido y nuestra picante salsa brava casera',
+        'en_desc': 'French fries bathed in creamy aioli, melted cheese and our homemade spicy brava sauce',
+        'price': Decimal('5.00'),
+        'ingredients': ('Alioli', 'Queso', 'Salsa brava')
+    }),
+    MappingProxyType({
+        'category_idx': 0,
+        'es_name': 'Patatas Carbonara',
+        'en_name': 'Carbonara Fries',
+        'es_desc': 'Deliciosas patatas cubiertas con cremosa salsa carbonara, crujiente bacon, huevo a la plancha y queso gratinado',
+        'en_desc': 'Delicious fries covered with creamy carbonara sauce, crispy bacon, fried egg and gratin cheese',
+        'price': Decimal('7.00'),
+        'ingredients': ('Salsa carbonara', 'Bacon', 'Huevo a la plancha', 'Queso gratinado')
+    }),
+    MappingProxyType({
+        'category_idx': 0,
+        'es_name': 'Nachos',
+        'en_name': 'Nachos',
+        'es_desc': 'Crujientes nachos de maíz cubiertos con salsa cheddar, queso fundido y sabrosa carne de kebab',
+        'en_desc': 'Crispy corn nachos topped with cheddar sauce, melted cheese and tasty kebab meat',
+        'price': Decimal('8.00'),
+        'ingredients': ('Nachos de maíz', 'Salsa cheddar', 'Queso', 'Carne de kebab')
+    }),
+
+    # ALGO LIGHT-FUSIÓN
+    MappingProxyType({
+        'category_idx': 1,
+        'es_name': 'Ensalada Equus',
+        'en_name': 'Equus Salad',
+        'es_desc': 'Fresca combinación de lechuga, tomate cherry, queso de cabra, pipas de girasol y calabaza, aceitunas negras, todo aliñado con nuestra especial vinagreta de arándanos',
+        'en_desc': 'Fresh combination of lettuce, cherry tomatoes, goat cheese, sunflower and pumpkin seeds, black olives, all dressed with our special cranberry vinaigrette',
+        'price': Decimal('8.50'),
+        'ingredients': ('Lechuga', 'Tomate cherry', 'Queso de cabra', 'Pipas de girasol', 'Pipas de calabaza', 'Aceitunas negras', 'Vinagreta de arándanos')
+    }),
+    MappingProxyType({
+        'category_idx': 1,
+        'es_name': 'Ensalada César',
+        'en_name': 'Caesar Salad',
+        'es_desc': 'Clásica ensalada césar con lechuga fresca, jugosos tacos de pollo a la plancha, queso parmesano, tomate cherry, crujientes picatostes y nuestra cremosa salsa césar',
+        'en_desc': 'Classic Caesar salad with fresh lettuce, juicy grilled chicken strips, parmesan cheese, cherry tomatoes, crispy croutons and our creamy Caesar dressing',
+        'price': Decimal('8.50'),
+        'ingredients': ('Lechuga', 'Pollo a la plancha', 'Queso parmesano', 'Tomate cherry', 'Picatostes', 'Salsa césar')
+    }),
+    MappingProxyType({
+        'category_idx': 1,
+        'es_name': 'Ensalada de Pesto con bola de helado',
+        'en_name': 'Pesto Salad with Ice Cream Ball',
+        'es_desc': 'Especial de temporada: Lechuga fresca, queso fresco de cabra, tomate cherry, nueces crujientes, salsa pesto aromática y sorprendente bola de helado de limón',
+        'en_desc': 'Seasonal special: Fresh lettuce, fresh goat cheese, cherry tomatoes, crunchy walnuts, aromatic pesto sauce and surprising lemon ice cream ball',
+        'price': Decimal('10.00'),
+        'ingredients': ('Lechuga', 'Queso fresco de cabra', 'Tomate cherry', 'Nueces', 'Salsa pesto', 'Helado de limón')
+    }),
+
+    # ENTRE PAN Y PAN
+    MappingProxyType({
+        'category_idx': 2,
+        'es_name': 'Pepito Equus',
+        'en_name': 'Equus Sandwich',
+        'es_desc': 'Delicioso bocadillo de atún con lechuga fresca y cremosa salsa rosa',
+        'en_desc': 'Delicious tuna sandwich with fresh lettuce and creamy pink sauce',
+        'price': Decimal('4.00'),
+        'ingredients': ('Atún', 'Lechuga', 'Salsa rosa')
+    }),
+    MappingProxyType({
+        'category_idx': 2,
+        'es_name': 'Pepito Serrano',
+        'en_name': 'Serrano Sandwich',
+        'es_desc': 'Tradicional bocadillo de jamón serrano con rodajas de tomate fresco y tu elección de aceite o mayonesa',
+        'en_desc': 'Traditional serrano ham sandwich with fresh tomato slices and your choice of oil or mayonnaise',
+        'price': Decimal('4.00'),
+        'ingredients': ('Jamón serrano', 'Rodajas de tomate', 'Aceite', 'Mayonesa')
+    }),
+    MappingProxyType({
+        'category_idx': 2,
+        'es_name': 'Pepito Willi',
+        'en_name': 'Willi Sandwich',
+        'es_desc': 'Bocadillo con tu elección de filete de pollo o cinta de lomo, acompañado de queso de cabra, tomate frito y aromática albahaca',
+        'en_desc': 'Sandwich with your choice of chicken fillet or pork loin, accompanied by goat cheese, fried tomato and aromatic basil',
+        'price': Decimal('4.50'),
+        'ingredients': ('Filete de pollo', 'Cinta de lomo', 'Queso de cabra', 'Tomate frito', 'Albahaca')
+    }),
+    MappingProxyType({
+        'category_idx': 2,
+        'es_name': 'Pepito Amyr',
+        'en_name': 'Amyr Sandwich',
+        'es_desc': 'Exquisito bocadillo de queso de cabra fresco a la plancha, jamón serrano, rodajas de tomate, aceite de oliva y orégano',
+        'en_desc': 'Exquisite sandwich with grilled fresh goat cheese, serrano ham, tomato slices, olive oil and oregano',
+        'price': Decimal('5.50'),
+        'ingredients': ('Queso fresco de cabra', 'Jamón serrano', 'Rodajas de tomate', 'Aceite', 'Orégano')
+    }),
+    MappingProxyType({
+        'category_idx': 2,
+        'es_name': 'Pepito Queso Fresco',
+        'en_name': 'Fresh Cheese Sandwich',
+        'es_desc': 'Simple y delicioso bocadillo de queso fresco con rodajas de tomate y un toque de aceite de oliva',
+        'en_desc': 'Simple and delicious fresh cheese sandwich with tomato slices and a touch of olive oil',
+        'price': Decimal('5.00'),
+        'ingredients': ('Queso fresco de cabra', 'Rodajas de tomate', 'Aceite')
+    }),
+    MappingProxyType({
+        'category_idx': 2,
+        'es_name': 'Perrito Caliente',
+        'en_name': 'Hot Dog',
+        'es_desc': 'Jugoso perrito caliente con salsa de cheddar, queso fundido, cebolla frita crujiente, mostaza, ketchup, mayonesa y patatas paja en su interior',
+        'en_desc': 'Juicy hot dog with cheddar sauce, melted cheese, crispy fried onion, mustard, ketchup, mayonnaise and shoestring fries inside',
+        'price': Decimal('5.00'),
+        'ingredients': ('Salchicha', 'Salsa cheddar', 'Queso', 'Cebolla frita', 'Mostaza', 'Ketchup', 'Mayonesa', 'Patatas paja')
+    }),
+    MappingProxyType({
+        'category_idx': 2,
+        'es_name': 'Sandwich Mixto',
+        'en_name': 'Mixed Sandwich',
+        'es_desc': 'Clásico sándwich mixto con jamón york y queso, tostado a la perfección',
+        'en_desc': 'Classic mixed sandwich with york ham and cheese, toasted to perfection',
+        'price': Decimal('4.00'),
+        'ingredients': ('Jamón york', 'Queso')
+    }),
+    MappingProxyType({
+        'category_idx': 2,
+        'es_name': 'Sandwich Vegetal',
+        'en_name': 'Veggie Sandwich',
+        'es_desc': 'Completo sándwich vegetal con jamón york, queso, mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Complete veggie sandwich with york ham, cheese, creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Jamón york', 'Queso', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+
+    # HAMBURGUESAS (Todas llevan mayonesa, lechuga, tomate y cebolla)
+    MappingProxyType({
+        'category_idx': 3,
+        'es_name': 'Hamburguesa de Pollo',
+        'en_name': 'Chicken Burger',
+        'es_desc': 'Jugosa hamburguesa de pollo a la parrilla con mayonesa cremosa, lechuga fresca, tomate maduro y cebolla crujiente',
+        'en_desc': 'Juicy grilled chicken burger with creamy mayonnaise, fresh lettuce, ripe tomato and crispy onion',
+        'price': Decimal('4.50'),
+        'ingredients': ('Hamburguesa de pollo', 'Mayonesa', 'Lechuga', 'Tomate', 'Cebolla')
+    }),
+    MappingProxyType({
+        'category_idx': 3,
+        'es_name': 'Hamburguesa de Cerdo',
+        'en_name': 'Pork Burger',
+        'es_desc': 'Sabrosa hamburguesa de cerdo con mayonesa cremosa, lechuga fresca, tomate maduro y cebolla crujiente',
+        'en_desc': 'Tasty pork burger with creamy mayonnaise, fresh lettuce, ripe tomato and crispy onion',
+        'price': Decimal('4.50'),
+        'ingredients': ('Hamburguesa de cerdo', 'Mayonesa', 'Lechuga', 'Tomate', 'Cebolla')
+    }),
+    MappingProxyType({
+        'category_idx': 3,
+        'es_name': 'Hamburguesa Vegana',
+        'en_name': 'Vegan Burger',
+        'es_desc': 'Deliciosa hamburguesa 100% vegetal con mayonesa, lechuga fresca, tomate maduro y cebolla crujiente',
+        'en_desc': 'Delicious 100% plant-based burger with mayonnaise, fresh lettuce, ripe tomato and crispy onion',
+        'price': Decimal('5.00'),
+        'ingredients': ('Hamburguesa vegana', 'Mayonesa', 'Lechuga', 'Tomate', 'Cebolla')
+    }),
+    MappingProxyType({
+        'category_idx': 3,
+        'es_name': 'Especial del día',
+        'en_name': 'Special of the Day',
+        'es_desc': 'Nuestra hamburguesa especial del día con mayonesa cremosa, lechuga fresca, tomate maduro y cebolla crujiente',
+        'en_desc': 'Our special burger of the day with creamy mayonnaise, fresh lettuce, ripe tomato and crispy onion',
+        'price': Decimal('5.00'),
+        'ingredients': ('Mayonesa', 'Lechuga', 'Tomate', 'Cebolla')
+    }),
+    MappingProxyType({
+        'category_idx': 3,
+        'es_name': 'Super Burger',
+        'en_name': 'Super Burger',
+        'es_desc': 'Nuestra hamburguesa más completa con mayonesa cremosa, lechuga fresca, tomate maduro y cebolla crujiente',
+        'en_desc': 'Our most complete burger with creamy mayonnaise, fresh lettuce, ripe tomato and crispy onion',
+        'price': Decimal('8.50'),
+        'ingredients': ('Mayonesa', 'Lechuga', 'Tomate', 'Cebolla')
+    }),
+    MappingProxyType({
+        'category_idx': 3,
+        'es_name': 'Burger a la Barbacoa',
+        'en_name': 'BBQ Burger',
+        'es_desc': 'Espectacular hamburguesa de ternera con salsa BBQ, bacon con huevo, lechuga, cebolla crujiente, tomate y sorprendente inyección de queso cheddar',
+        'en_desc': 'Spectacular beef burger with BBQ sauce, bacon with egg, lettuce, crispy onion, tomato and surprising cheddar cheese injection',
+        'price': Decimal('7.00'),
+        'ingredients': ('Hamburguesa de ternera', 'BBQ', 'Bacon con huevo', 'Lechuga', 'Cebolla crujiente', 'Tomate', 'Inyección de queso cheddar')
+    }),
+
+    # MONTADITOS (Todos llevan mayonesa, lechuga y tomate)
+    MappingProxyType({
+        'category_idx': 4,
+        'es_name': 'Montadito de Cinta de Lomo',
+        'en_name': 'Pork Loin Small Sandwich',
+        'es_desc': 'Sabroso montadito de cinta de lomo con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Tasty pork loin small sandwich with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Cinta de lomo', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 4,
+        'es_name': 'Montadito de Filete de Pollo',
+        'en_name': 'Chicken Fillet Small Sandwich',
+        'es_desc': 'Jugoso montadito de filete de pollo con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Juicy chicken fillet small sandwich with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Filete de pollo', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 4,
+        'es_name': 'Montadito de Lomo Adobado',
+        'en_name': 'Marinated Loin Small Sandwich',
+        'es_desc': 'Delicioso montadito de lomo adobado con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Delicious marinated pork loin small sandwich with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Lomo adobado', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+
+    # CAMPEROS (Todos llevan mayonesa, lechuga y tomate)
+    MappingProxyType({
+        'category_idx': 5,
+        'es_name': 'Campero Mixto',
+        'en_name': 'Mixed Campero',
+        'es_desc': 'Campero mixto en pan especial con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Mixed campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Mixto', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 5,
+        'es_name': 'Campero de Filete de Pollo',
+        'en_name': 'Chicken Fillet Campero',
+        'es_desc': 'Campero de filete de pollo en pan especial con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Chicken fillet campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Filete de pollo', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 5,
+        'es_name': 'Campero de Pollo Asado',
+        'en_name': 'Roasted Chicken Campero',
+        'es_desc': 'Campero de jugoso pollo asado en pan especial con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Juicy roasted chicken campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Pollo asado', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 5,
+        'es_name': 'Campero de Cinta de Lomo',
+        'en_name': 'Pork Loin Campero',
+        'es_desc': 'Campero de cinta de lomo en pan especial con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Pork loin campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Cinta de lomo', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 5,
+        'es_name': 'Campero de Kebab',
+        'en_name': 'Kebab Campero',
+        'es_desc': 'Campero de sabrosa carne de kebab en pan especial con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Tasty kebab meat campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('5.00'),
+        'ingredients': ('Carne de kebab', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 5,
+        'es_name': 'Campero de Bacon',
+        'en_name': 'Bacon Campero',
+        'es_desc': 'Campero de crujiente bacon en pan especial con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Crispy bacon campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Bacon', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 5,
+        'es_name': 'Campero de Atún',
+        'en_name': 'Tuna Campero',
+        'es_desc': 'Campero de atún en pan especial con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Tuna campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('5.00'),
+        'ingredients': ('Atún', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+    MappingProxyType({
+        'category_idx': 5,
+        'es_name': 'Campero de Huevo',
+        'en_name': 'Egg Campero',
+        'es_desc': 'Campero de huevo en pan especial con mayonesa cremosa, lechuga fresca y tomate',
+        'en_desc': 'Egg campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
+        'price': Decimal('4.50'),
+        'ingredients': ('Huevo', 'Mayonesa', 'Lechuga', 'Tomate')
+    }),
+
+    # SERRANITOS
+    MappingProxyType({
+        'category_idx': 6,
+        'es_name': 'Serranito de Pollo',
+        'en_name': 'Chicken Serranito',
+        'es_desc': 'Tradicional serranito andaluz con jugoso filete de pollo, jamón serrano, pimiento frito y tu elección de alioli o mayonesa',
+        'en_desc': 'Traditional Andalusian serranito with juicy chicken fillet, serrano ham, fried pepper and your choice of aioli or mayonnaise',
+        'price': Decimal('5.00'),
+        'ingredients': ('Filete de pollo', 'Jamón serrano', 'Pimiento', 'Alioli', 'Mayonesa')
+    }),
+    MappingProxyType({
+        'category_idx': 6,
+        'es_name': 'Serranito de Lomo',
+        'en_name': 'Pork Loin Serranito',
+        'es_desc': 'Tradicional serranito andaluz con sabrosa cinta de lomo, jamón serrano, pimiento frito y tu elección de alioli o mayonesa',
+        'en_desc': 'Traditional Andalusian serranito with tasty pork loin, serrano ham, fried pepper and your choice of aioli or mayonnaise',
+        'price': Decimal('5.00'),
+        'ingredients': ('Cinta de lomo', 'Jamón serrano', 'Pimiento', 'Alioli', 'Mayonesa')
+    }),
+
+    # COMBINADOS
+    MappingProxyType({
+        'category_idx': 7,
+        'es_name': 'Combinado de Kebab',
+        'en_name': 'Kebab Combo',
+        'es_desc': 'Completo plato combinado con torta de trigo, jugosa carne de kebab, lechuga, tomate, cebolla y crujientes patatas fritas. Incluye tu elección de salsa: yogurt, barbacoa, césar o brava',
+        'en_desc': 'Complete combo plate with wheat tortilla, juicy kebab meat, lettuce, tomato, onion and crispy french fries. Includes your choice of sauce: yogurt, BBQ, caesar or spicy',
+        'price': Decimal('9.00'),
+        'ingredients': ('Torta de trigo', 'Carne de kebab', 'Lechuga', 'Tomate', 'Cebolla', 'Patatas fritas', 'Salsa de yogurt', 'Salsa barbacoa', 'Salsa césar', 'Salsa brava')
+    }),
+    MappingProxyType({
+        'category_idx': 7,
+        'es_name': 'Combinado de Pollo Asado',
+        'en_name': 'Roasted Chicken Combo',
+        'es_desc': 'Completo plato combinado con torta de trigo, jugoso pollo asado, lechuga, tomate, cebolla y crujientes patatas fritas. Incluye tu elección de salsa: yogurt, barbacoa, césar o brava',
+        'en_desc': 'Complete combo plate with wheat tortilla, juicy roasted chicken, lettuce, tomato, onion and crispy french fries. Includes your choice of sauce: yogurt, BBQ, caesar or spicy',
+        'price': Decimal('9.00'),
+        'ingredients': ('Torta de trigo', 'Pollo asado', 'Lechuga', 'Tomate', 'Cebolla', 'Patatas fritas', 'Salsa de yogurt', 'Salsa barbacoa', 'Salsa césar', 'Salsa brava')
+    }),
+)
+
+
+def _normalize_name(name):
+    """Return the key used to match ingredient names regardless of case/padding."""
+    return name.strip().lower()
+
 
 class Command(BaseCommand):
     help = 'Load the complete Equus menu (carta) into the database'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Build every model instance but skip all database writes',
+        )
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Print cProfile statistics for each loading phase',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BULK_BATCH_SIZE,
+            help=f'Rows per INSERT statement (default: {BULK_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--use-copy',
+            action='store_true',
+            help='Load products and their translations with COPY (PostgreSQL only)',
+        )
+
+    @transaction.atomic
     def handle(self, *args, **options):
+        self.dry_run = options['dry_run']
+        self.profile = options['profile']
+        self.batch_size = options['batch_size']
+        self.use_copy = options['use_copy']
+        if self.use_copy and connection.vendor != 'postgresql':
+            raise CommandError('--use-copy requires a PostgreSQL database')
         self.stdout.write(self.style.SUCCESS('Starting to load carta...'))
+        self._defer_constraints()
 
         # Create categories
         self.stdout.write('Creating categories...')
-        categories = self.create_categories()
+        categories = self._run_phase(self.create_categories)
 
         # Create ingredients
         self.stdout.write('Creating ingredients...')
-        ingredients = self.create_ingredients()
+        ingredients = self._run_phase(self.create_ingredients)
 
         # Create products
         self.stdout.write('Creating products...')
-        self.create_products(categories, ingredients)
+        self._run_phase(self.create_products, categories, ingredients)
+
+        if self.dry_run:
+            self.stdout.write(self.style.WARNING('Dry run finished, nothing was written.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('✅ Carta loaded successfully!'))
+
+    def _run_phase(self, func, *args):
+        """Run a loading phase, under cProfile when --profile is given."""
+        if not self.profile:
+            return func(*args)
+
+        profiler = cProfile.Profile()
+        result = profiler.runcall(func, *args)
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats('cumulative').print_stats(15)
+        self.stdout.write(buffer.getvalue())
+        return result
+
+    def _bulk_create(self, model, objs, **kwargs):
+        """Insert ``objs`` in batches, or just return them on --dry-run."""
+        if self.dry_run:
+            return objs
+        return model.objects.bulk_create(objs, batch_size=self.batch_size, **kwargs)
+
+    def _insert(self, model, objs):
+        """Insert ``objs`` with COPY when --use-copy is given, else bulk_create."""
+        if self.use_copy and not self.dry_run:
+            self._copy(model, objs)
+            return objs
+        return self._bulk_create(model, objs)
+
+    def _copy(self, model, objs):
+        """Stream ``objs`` into ``model``'s table with a single COPY.
+
+        Primary keys are reserved from the table's sequence first, so the
+        instances carry their ids just like after bulk_create. Every
+        concrete column is sent, with values prepared by the fields
+        themselves (auto_now timestamps included).
+        """
+        if not objs:
+            return
+        opts = model._meta
+        fields = opts.concrete_fields
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT nextval(pg_get_serial_sequence(%s, %s)) '
+                'FROM generate_series(1, %s)',
+                [opts.db_table, opts.pk.column, len(objs)],
+            )
+            for obj, (pk,) in zip(objs, cursor.fetchall()):
+                obj.pk = pk
+                writer.writerow([
+                    r'\N' if value is None else value
+                    for value in (
+                        field.get_db_prep_save(field.pre_save(obj, True), connection)
+                        for field in fields
+                    )
+                ])
+            buffer.seek(0)
+            columns = ', '.join(connection.ops.quote_name(f.column) for f in fields)
+            cursor.copy_expert(
+                f'COPY {connection.ops.quote_name(opts.db_table)} ({columns}) '
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
 
-        self.stdout.write(self.style.SUCCESS('✅ Carta loaded successfully!'))
+    def _defer_constraints(self):
+        """Check foreign keys once at COMMIT instead of per inserted row.
+
+        Django declares its PostgreSQL foreign keys DEFERRABLE, so this only
+        needs to be issued inside the surrounding transaction. Other
+        backends are left untouched.
+        """
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET CONSTRAINTS ALL DEFERRED')
 
     def create_categories(self):
-        """Create all menu categories."""
+        """Create all menu categories.
+
+        Returns a list ordered like ``categories_data`` so products can
+        reference their category by position (``category_idx``).
+        """
         categories_data = [
-            {
+            {  # 0
                 'es': {'name': 'Para Picar', 'description': 'Deliciosos aperitivos para compartir'},
                 'en': {'name': 'Appetizers', 'description': 'Delicious starters to share'}
             },
-            {
+            {  # 1
                 'es': {'name': 'Algo Light–Fusión', 'description': 'Opciones ligeras y saludables con un toque especial'},
                 'en': {'name': 'Light Fusion', 'description': 'Light and healthy options with a special touch'}
             },
-            {
+            {  # 2
                 'es': {'name': 'Entre Pan y Pan', 'description': 'Bocadillos y sándwiches para todos los gustos'},
                 'en': {'name': 'Sandwiches', 'description': 'Sandwiches for all tastes'}
             },
-            {
+            {  # 3
                 'es': {'name': 'Hamburguesas', 'description': 'Nuestras jugosas hamburguesas artesanales'},
                 'en': {'name': 'Burgers', 'description': 'Our juicy artisan burgers'}
             },
-            {
+            {  # 4
                 'es': {'name': 'Montaditos', 'description': 'Montaditos recién preparados'},
                 'en': {'name': 'Small Sandwiches', 'description': 'Freshly prepared small sandwiches'}
             },
-            {
+            {  # 5
                 'es': {'name': 'Camperos', 'description': 'Bocadillos camperos en pan especial'},
                 'en': {'name': 'Camperos', 'description': 'Campero sandwiches on special bread'}
             },
-            {
+            {  # 6
                 'es': {'name': 'Serranitos', 'description': 'Tradicionales serranitos andaluces'},
                 'en': {'name': 'Serranitos', 'description': 'Traditional Andalusian serranitos'}
             },
-            {
+            {  # 7
                 'es': {'name': 'Combinados', 'description': 'Platos combinados completos'},
                 'en': {'name': 'Combo Plates', 'description': 'Complete combo plates'}
             },
         ]
 
-        categories = {}
-        for idx, cat_data in enumerate(categories_data, 1):
-            category = Category.objects.create()
-            category.set_current_language('es')
-            category.name = cat_data['es']['name']
-            category.description = cat_data['es']['description']
-            category.set_current_language('en')
-            category.name = cat_data['en']['name']
-            category.description = cat_data['en']['description']
-            category.save()
-            categories[cat_data['es']['name']] = category
-            self.stdout.write(f'  ✓ Created category: {cat_data["es"]["name"]}')
+        categories = self._bulk_create(Category, [Category() for _ in categories_data])
+
+        translations = []
+        for category, cat_data in zip(categories, categories_data):
+            for lang in ('es', 'en'):
+                translations.append(CategoryTranslation(
+                    master_id=category.pk,
+                    language_code=lang,
+                    name=cat_data[lang]['name'],
+                    description=cat_data[lang]['description'],
+                ))
+        self._bulk_create(CategoryTranslation, translations)
+
+        self.stdout.write(f'  ✓ Created {len(categories)} categories')
 
         return categories
 
     def create_ingredients(self):
-        """Create all ingredients including extras."""
-        ingredients_data = [
-            # Básicos comunes
-            {'es': 'Mayonesa', 'en': 'Mayonnaise', 'icon': '🥄', 'extra': False, 'price': '0.00'},
-            {'es': 'Lechuga', 'en': 'Lettuce', 'icon': '🥬', 'extra': False, 'price': '0.00'},
-            {'es': 'Tomate', 'en': 'Tomato', 'icon': '🍅', 'extra': False, 'price': '0.00'},
-            {'es': 'Cebolla', 'en': 'Onion', 'icon': '🧅', 'extra': False, 'price': '0.00'},
-
-            # Para Picar
-            {'es': 'Salsa de yogurt', 'en': 'Yogurt sauce', 'icon': '🥛', 'extra': False, 'price': '0.00'},
-            {'es': 'Salsa barbacoa', 'en': 'BBQ sauce', 'icon': '🍖', 'extra': False, 'price': '0.00'},
-            {'es': 'Alioli', 'en': 'Aioli', 'icon': '🧄', 'extra': False, 'price': '0.00'},
-            {'es': 'Carne de kebab', 'en': 'Kebab meat', 'icon': '🥙', 'extra': False, 'price': '0.00'},
-            {'es': 'Queso gratinado', 'en': 'Gratin cheese', 'icon': '🧀', 'extra': False, 'price': '0.00'},
-            {'es': 'Queso', 'en': 'Cheese', 'icon': '🧀', 'extra': True, 'price': '0.50'},
-            {'es': 'Salsa brava', 'en': 'Spicy sauce', 'icon': '🌶️', 'extra': False, 'price': '0.00'},
-            {'es': 'Salsa carbonara', 'en': 'Carbonara sauce', 'icon': '🥓', 'extra': False, 'price': '0.00'},
-            {'es': 'Bacon', 'en': 'Bacon', 'icon': '🥓', 'extra': True, 'price': '0.50'},
-            {'es': 'Huevo a la plancha', 'en': 'Fried egg', 'icon': '🍳', 'extra': False, 'price': '0.00'},
-            {'es': 'Nachos de maíz', 'en': 'Corn nachos', 'icon': '🌽', 'extra': False, 'price': '0.00'},
-            {'es': 'Salsa cheddar', 'en': 'Cheddar sauce', 'icon': '🧀', 'extra': False, 'price': '0.00'},
-
-            # Ensaladas
-            {'es': 'Tomate cherry', 'en': 'Cherry tomato', 'icon': '🍅', 'extra': False, 'price': '0.00'},
-            {'es': 'Queso de cabra', 'en': 'Goat cheese', 'icon': '🧀', 'extra': True, 'price': '0.50'},
-            {'es': 'Pipas de girasol', 'en': 'Sunflower seeds', 'icon': '🌻', 'extra': False, 'price': '0.00'},
-            {'es': 'Pipas de calabaza', 'en': 'Pumpkin seeds', 'icon': '🎃', 'extra': False, 'price': '0.00'},
-            {'es': 'Aceitunas negras', 'en': 'Black olives', 'icon': '🫒', 'extra': False, 'price': '0.00'},
-            {'es': 'Vinagreta de arándanos', 'en': 'Cranberry vinaigrette', 'icon': '🫐', 'extra': False, 'price': '0.00'},
-            {'es': 'Pollo a la plancha', 'en': 'Grilled chicken', 'icon': '🍗', 'extra': False, 'price': '0.00'},
-            {'es': 'Queso parmesano', 'en': 'Parmesan cheese', 'icon': '🧀', 'extra': False, 'price': '0.00'},
-            {'es': 'Picatostes', 'en': 'Croutons', 'icon': '🍞', 'extra': False, 'price': '0.00'},
-            {'es': 'Salsa césar', 'en': 'Caesar dressing', 'icon': '🥗', 'extra': False, 'price': '0.00'},
-            {'es': 'Queso fresco de cabra', 'en': 'Fresh goat cheese', 'icon': '🧀', 'extra': False, 'price': '0.00'},
-            {'es': 'Nueces', 'en': 'Walnuts', 'icon': '🌰', 'extra': False, 'price': '0.00'},
-            {'es': 'Salsa pesto', 'en': 'Pesto sauce', 'icon': '🌿', 'extra': False, 'price': '0.00'},
-            {'es': 'Helado de limón', 'en': 'Lemon ice cream', 'icon': '🍋', 'extra': False, 'price': '0.00'},
-
-            # Bocadillos y sandwiches
-            {'es': 'Atún', 'en': 'Tuna', 'icon': '🐟', 'extra': False, 'price': '0.00'},
-            {'es': 'Salsa rosa', 'en': 'Pink sauce', 'icon': '🥄', 'extra': False, 'price': '0.00'},
-            {'es': 'Jamón serrano', 'en': 'Serrano ham', 'icon': '🥓', 'extra': True, 'price': '0.50'},
-            {'es': 'Rodajas de tomate', 'en': 'Tomato slices', 'icon': '🍅', 'extra': False, 'price': '0.00'},
-            {'es': 'Aceite', 'en': 'Oil', 'icon': '🫒', 'extra': False, 'price': '0.00'},
-            {'es': 'Filete de pollo', 'en': 'Chicken fillet', 'icon': '🍗', 'extra': False, 'price': '0.00'},
-            {'es': 'Cinta de lomo', 'en': 'Pork loin', 'icon': '🥩', 'extra': False, 'price': '0.00'},
-            {'es': 'Tomate frito', 'en': 'Fried tomato', 'icon': '🍅', 'extra': False, 'price': '0.00'},
-            {'es': 'Albahaca', 'en': 'Basil', 'icon': '🌿', 'extra': False, 'price': '0.00'},
-            {'es': 'Orégano', 'en': 'Oregano', 'icon': '🌿', 'extra': False, 'price': '0.00'},
-            {'es': 'Salchicha', 'en': 'Sausage', 'icon': '🌭', 'extra': False, 'price': '0.00'},
-            {'es': 'Cebolla frita', 'en': 'Fried onion', 'icon': '🧅', 'extra': False, 'price': '0.00'},
-            {'es': 'Mostaza', 'en': 'Mustard', 'icon': '🌭', 'extra': False, 'price': '0.00'},
-            {'es': 'Ketchup', 'en': 'Ketchup', 'icon': '🍅', 'extra': False, 'price': '0.00'},
-            {'es': 'Patatas paja', 'en': 'Shoestring fries', 'icon': '🍟', 'extra': False, 'price': '0.00'},
-            {'es': 'Jamón york', 'en': 'York ham', 'icon': '🥓', 'extra': True, 'price': '0.50'},
-
-            # Hamburguesas
-            {'es': 'Hamburguesa de pollo', 'en': 'Chicken patty', 'icon': '🍗', 'extra': False, 'price': '0.00'},
-            {'es': 'Hamburguesa de cerdo', 'en': 'Pork patty', 'icon': '🥩', 'extra': False, 'price': '0.00'},
-            {'es': 'Hamburguesa vegana', 'en': 'Vegan patty', 'icon': '🥬', 'extra': False, 'price': '0.00'},
-            {'es': 'Hamburguesa de ternera', 'en': 'Beef patty', 'icon': '🥩', 'extra': False, 'price': '0.00'},
-            {'es': 'BBQ', 'en': 'BBQ sauce', 'icon': '🍖', 'extra': False, 'price': '0.00'},
-            {'es': 'Bacon con huevo', 'en': 'Bacon with egg', 'icon': '🥓', 'extra': False, 'price': '0.00'},
-            {'es': 'Cebolla crujiente', 'en': 'Crispy onion', 'icon': '🧅', 'extra': False, 'price': '0.00'},
-            {'es': 'Inyección de queso cheddar', 'en': 'Cheddar cheese injection', 'icon': '🧀', 'extra': False, 'price': '0.00'},
-            {'es': 'Cheddar', 'en': 'Cheddar', 'icon': '🧀', 'extra': True, 'price': '0.50'},
-
-            # Montaditos
-            {'es': 'Lomo adobado', 'en': 'Marinated pork loin', 'icon': '🥩', 'extra': False, 'price': '0.00'},
-
-            # Camperos
-            {'es': 'Mixto', 'en': 'Mixed', 'icon': '🥪', 'extra': False, 'price': '0.00'},
-            {'es': 'Pollo asado', 'en': 'Roasted chicken', 'icon': '🍗', 'extra': False, 'price': '0.00'},
-            {'es': 'Huevo', 'en': 'Egg', 'icon': '🥚', 'extra': True, 'price': '0.50'},
-
-            # Serranitos
-            {'es': 'Pimiento', 'en': 'Pepper', 'icon': '🫑', 'extra': False, 'price': '0.00'},
-            {'es': 'Pimiento frito', 'en': 'Fried pepper', 'icon': '🫑', 'extra': True, 'price': '0.50'},
-
-            # Combinado
-            {'es': 'Torta de trigo', 'en': 'Wheat tortilla', 'icon': '🌯', 'extra': False, 'price': '0.00'},
-            {'es': 'Patatas fritas', 'en': 'French fries', 'icon': '🍟', 'extra': False, 'price': '0.00'},
-
-            # Extras adicionales mencionados
-            {'es': 'Pan sin gluten', 'en': 'Gluten-free bread', 'icon': '🍞', 'extra': True, 'price': '0.50'},
-        ]
+        """Create all ingredients including extras.
+
+        Returns a dict mapping every normalized ingredient name (Spanish and
+        English) to its primary key, so products resolve their ingredients
+        with plain dict lookups. Spanish names win over English ones.
+        """
+        created = self._bulk_create(Ingredient, [
+            Ingredient(
+                icon=ing_def.icon,
+                be_extra=ing_def.extra,
+                price=ing_def.price
+            )
+            for ing_def in INGREDIENTS
+        ])
 
+        translations = []
         ingredients = {}
-        for ing_data in ingredients_data:
-            ingredient = Ingredient.objects.create(
-                icon=ing_data['icon'],
-                be_extra=ing_data['extra'],
-                price=Decimal(ing_data['price'])
-            )
-            ingredient.set_current_language('es')
-            ingredient.name = ing_data['es']
-            ingredient.set_current_language('en')
-            ingredient.name = ing_data['en']
-            ingredient.save()
-            ingredients[ing_data['es']] = ingredient
-
-        self.stdout.write(f'  ✓ Created {len(ingredients)} ingredients')
+        for ingredient, ing_def in zip(created, INGREDIENTS):
+            for lang, name in (('es', ing_def.es), ('en', ing_def.en)):
+                translations.append(IngredientTranslation(
+                    master_id=ingredient.pk,
+                    language_code=lang,
+                    name=name,
+                ))
+            ingredients[_normalize_name(ing_def.es)] = ingredient.pk
+        for ingredient, ing_def in zip(created, INGREDIENTS):
+            ingredients.setdefault(_normalize_name(ing_def.en), ingredient.pk)
+        self._bulk_create(IngredientTranslation, translations)
+
+        self.stdout.write(f'  ✓ Created {len(created)} ingredients')
         return ingredients
 
     def create_products(self, categories, ingredients):
         """Create all products with their relationships."""
 
-        # Helper function to get ingredient IDs
+        # Helper function to get ingredient IDs (one dict lookup per name)
         def get_ing_ids(ing_names):
-            return [ingredients[name] for name in ing_names if name in ingredients]
-
-        products_data = [
-            # PARA PICAR
-            {
-                'category': 'Para Picar',
-                'es_name': 'Patatas Fritas',
-                'en_name': 'French Fries',
-                'es_desc': 'Crujientes patatas fritas doradas, perfectas para acompañar o disfrutar solas',
-                'en_desc': 'Crispy golden french fries, perfect to share or enjoy alone',
-                'price': '4.00',
-                'ingredients': []
-            },
-            {
-                'category': 'Para Picar',
-                'es_name': 'Patatas Gratinadas',
-                'en_name': 'Gratin Fries',
-                'es_desc': 'Crujientes patatas fritas con tu elección de salsa (yogurt, barbacoa o alioli), jugosa carne de kebab y generosa capa de queso gratinado',
-                'en_desc': 'Crispy fries with your choice of sauce (yogurt, BBQ or aioli), juicy kebab meat and generous layer of gratin cheese',
-                'price': '5.00',
-                'ingredients': ['Salsa de yogurt', 'Salsa barbacoa', 'Alioli', 'Carne de kebab', 'Queso gratinado']
-            },
-            {
-                'category': 'Para Picar',
-                'es_name': 'Patatas Bravas',
-                'en_name': 'Patatas Bravas',
-                'es_desc': 'Patatas fritas bañadas en alioli cremoso, queso fundido y nuestra picante salsa brava casera',
-                'en_desc': 'French fries bathed in creamy aioli, melted cheese and our homemade spicy brava sauce',
-                'price': '5.00',
-                'ingredients': ['Alioli', 'Queso', 'Salsa brava']
-            },
-            {
-                'category': 'Para Picar',
-                'es_name': 'Patatas Carbonara',
-                'en_name': 'Carbonara Fries',
-                'es_desc': 'Deliciosas patatas cubiertas con cremosa salsa carbonara, crujiente bacon, huevo a la plancha y queso gratinado',
-                'en_desc': 'Delicious fries covered with creamy carbonara sauce, crispy bacon, fried egg and gratin cheese',
-                'price': '7.00',
-                'ingredients': ['Salsa carbonara', 'Bacon', 'Huevo a la plancha', 'Queso gratinado']
-            },
-            {
-                'category': 'Para Picar',
-                'es_name': 'Nachos',
-                'en_name': 'Nachos',
-                'es_desc': 'Crujientes nachos de maíz cubiertos con salsa cheddar, queso fundido y sabrosa carne de kebab',
-                'en_desc': 'Crispy corn nachos topped with cheddar sauce, melted cheese and tasty kebab meat',
-                'price': '8.00',
-                'ingredients': ['Nachos de maíz', 'Salsa cheddar', 'Queso', 'Carne de kebab']
-            },
+            keys = map(_normalize_name, ing_names)
+            return [i for i in map(ingredients.get, keys) if i is not None]
 
-            # ALGO LIGHT-FUSIÓN
-            {
-                'category': 'Algo Light–Fusión',
-                'es_name': 'Ensalada Equus',
-                'en_name': 'Equus Salad',
-                'es_desc': 'Fresca combinación de lechuga, tomate cherry, queso de cabra, pipas de girasol y calabaza, aceitunas negras, todo aliñado con nuestra especial vinagreta de arándanos',
-                'en_desc': 'Fresh combination of lettuce, cherry tomatoes, goat cheese, sunflower and pumpkin seeds, black olives, all dressed with our special cranberry vinaigrette',
-                'price': '8.50',
-                'ingredients': ['Lechuga', 'Tomate cherry', 'Queso de cabra', 'Pipas de girasol', 'Pipas de calabaza', 'Aceitunas negras', 'Vinagreta de arándanos']
-            },
-            {
-                'category': 'Algo Light–Fusión',
-                'es_name': 'Ensalada César',
-                'en_name': 'Caesar Salad',
-                'es_desc': 'Clásica ensalada césar con lechuga fresca, jugosos tacos de pollo a la plancha, queso parmesano, tomate cherry, crujientes picatostes y nuestra cremosa salsa césar',
-                'en_desc': 'Classic Caesar salad with fresh lettuce, juicy grilled chicken strips, parmesan cheese, cherry tomatoes, crispy croutons and our creamy Caesar dressing',
-                'price': '8.50',
-                'ingredients': ['Lechuga', 'Pollo a la plancha', 'Queso parmesano', 'Tomate cherry', 'Picatostes', 'Salsa césar']
-            },
-            {
-                'category': 'Algo Light–Fusión',
-                'es_name': 'Ensalada de Pesto con bola de helado',
-                'en_name': 'Pesto Salad with Ice Cream Ball',
-                'es_desc': 'Especial de temporada: Lechuga fresca, queso fresco de cabra, tomate cherry, nueces crujientes, salsa pesto aromática y sorprendente bola de helado de limón',
-                'en_desc': 'Seasonal special: Fresh lettuce, fresh goat cheese, cherry tomatoes, crunchy walnuts, aromatic pesto sauce and surprising lemon ice cream ball',
-                'price': '10.00',
-                'ingredients': ['Lechuga', 'Queso fresco de cabra', 'Tomate cherry', 'Nueces', 'Salsa pesto', 'Helado de limón']
-            },
-
-            # ENTRE PAN Y PAN
-            {
-                'category': 'Entre Pan y Pan',
-                'es_name': 'Pepito Equus',
-                'en_name': 'Equus Sandwich',
-                'es_desc': 'Delicioso bocadillo de atún con lechuga fresca y cremosa salsa rosa',
-                'en_desc': 'Delicious tuna sandwich with fresh lettuce and creamy pink sauce',
-                'price': '4.00',
-                'ingredients': ['Atún', 'Lechuga', 'Salsa rosa']
-            },
-            {
-                'category': 'Entre Pan y Pan',
-                'es_name': 'Pepito Serrano',
-                'en_name': 'Serrano Sandwich',
-                'es_desc': 'Tradicional bocadillo de jamón serrano con rodajas de tomate fresco y tu elección de aceite o mayonesa',
-                'en_desc': 'Traditional serrano ham sandwich with fresh tomato slices and your choice of oil or mayonnaise',
-                'price': '4.00',
-                'ingredients': ['Jamón serrano', 'Rodajas de tomate', 'Aceite', 'Mayonesa']
-            },
-            {
-                'category': 'Entre Pan y Pan',
-                'es_name': 'Pepito Willi',
-                'en_name': 'Willi Sandwich',
-                'es_desc': 'Bocadillo con tu elección de filete de pollo o cinta de lomo, acompañado de queso de cabra, tomate frito y aromática albahaca',
-                'en_desc': 'Sandwich with your choice of chicken fillet or pork loin, accompanied by goat cheese, fried tomato and aromatic basil',
-                'price': '4.50',
-                'ingredients': ['Filete de pollo', 'Cinta de lomo', 'Queso de cabra', 'Tomate frito', 'Albahaca']
-            },
-            {
-                'category': 'Entre Pan y Pan',
-                'es_name': 'Pepito Amyr',
-                'en_name': 'Amyr Sandwich',
-                'es_desc': 'Exquisito bocadillo de queso de cabra fresco a la plancha, jamón serrano, rodajas de tomate, aceite de oliva y orégano',
-                'en_desc': 'Exquisite sandwich with grilled fresh goat cheese, serrano ham, tomato slices, olive oil and oregano',
-                'price': '5.50',
-                'ingredients': ['Queso fresco de cabra', 'Jamón serrano', 'Rodajas de tomate', 'Aceite', 'Orégano']
-            },
-            {
-                'category': 'Entre Pan y Pan',
-                'es_name': 'Pepito Queso Fresco',
-                'en_name': 'Fresh Cheese Sandwich',
-                'es_desc': 'Simple y delicioso bocadillo de queso fresco con rodajas de tomate y un toque de aceite de oliva',
-                'en_desc': 'Simple and delicious fresh cheese sandwich with tomato slices and a touch of olive oil',
-                'price': '5.00',
-                'ingredients': ['Queso fresco de cabra', 'Rodajas de tomate', 'Aceite']
-            },
-            {
-                'category': 'Entre Pan y Pan',
-                'es_name': 'Perrito Caliente',
-                'en_name': 'Hot Dog',
-                'es_desc': 'Jugoso perrito caliente con salsa de cheddar, queso fundido, cebolla frita crujiente, mostaza, ketchup, mayonesa y patatas paja en su interior',
-                'en_desc': 'Juicy hot dog with cheddar sauce, melted cheese, crispy fried onion, mustard, ketchup, mayonnaise and shoestring fries inside',
-                'price': '5.00',
-                'ingredients': ['Salchicha', 'Salsa cheddar', 'Queso', 'Cebolla frita', 'Mostaza', 'Ketchup', 'Mayonesa', 'Patatas paja']
-            },
-            {
-                'category': 'Entre Pan y Pan',
-                'es_name': 'Sandwich Mixto',
-                'en_name': 'Mixed Sandwich',
-                'es_desc': 'Clásico sándwich mixto con jamón york y queso, tostado a la perfección',
-                'en_desc': 'Classic mixed sandwich with york ham and cheese, toasted to perfection',
-                'price': '4.00',
-                'ingredients': ['Jamón york', 'Queso']
-            },
-            {
-                'category': 'Entre Pan y Pan',
-                'es_name': 'Sandwich Vegetal',
-                'en_name': 'Veggie Sandwich',
-                'es_desc': 'Completo sándwich vegetal con jamón york, queso, mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Complete veggie sandwich with york ham, cheese, creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Jamón york', 'Queso', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-
-            # HAMBURGUESAS (Todas llevan mayonesa, lechuga, tomate y cebolla)
-            {
-                'category': 'Hamburguesas',
-                'es_name': 'Hamburguesa de Pollo',
-                'en_name': 'Chicken Burger',
-                'es_desc': 'Jugosa hamburguesa de pollo a la parrilla con mayonesa cremosa, lechuga fresca, tomate maduro y cebolla crujiente',
-                'en_desc': 'Juicy grilled chicken burger with creamy mayonnaise, fresh lettuce, ripe tomato and crispy onion',
-                'price': '4.50',
-                'ingredients': ['Hamburguesa de pollo', 'Mayonesa', 'Lechuga', 'Tomate', 'Cebolla']
-            },
-            {
-                'category': 'Hamburguesas',
-                'es_name': 'Hamburguesa de Cerdo',
-                'en_name': 'Pork Burger',
-                'es_desc': 'Sabrosa hamburguesa de cerdo con mayonesa cremosa, lechuga fresca, tomate maduro y cebolla crujiente',
-                'en_desc': 'Tasty pork burger with creamy mayonnaise, fresh lettuce, ripe tomato and crispy onion',
-                'price': '4.50',
-                'ingredients': ['Hamburguesa de cerdo', 'Mayonesa', 'Lechuga', 'Tomate', 'Cebolla']
-            },
-            {
-                'category': 'Hamburguesas',
-                'es_name': 'Hamburguesa Vegana',
-                'en_name': 'Vegan Burger',
-                'es_desc': 'Deliciosa hamburguesa 100% vegetal con mayonesa, lechuga fresca, tomate maduro y cebolla crujiente',
-                'en_desc': 'Delicious 100% plant-based burger with mayonnaise, fresh lettuce, ripe tomato and crispy onion',
-                'price': '5.00',
-                'ingredients': ['Hamburguesa vegana', 'Mayonesa', 'Lechuga', 'Tomate', 'Cebolla']
-            },
-            {
-                'category': 'Hamburguesas',
-                'es_name': 'Especial del día',
-                'en_name': 'Special of the Day',
-                'es_desc': 'Nuestra hamburguesa especial del día con mayonesa cremosa, lechuga fresca, tomate maduro y cebolla crujiente',
-                'en_desc': 'Our special burger of the day with creamy mayonnaise, fresh lettuce, ripe tomato and crispy onion',
-                'price': '5.00',
-                'ingredients': ['Mayonesa', 'Lechuga', 'Tomate', 'Cebolla']
-            },
-            {
-                'category': 'Hamburguesas',
-                'es_name': 'Super Burger',
-                'en_name': 'Super Burger',
-                'es_desc': 'Nuestra hamburguesa más completa con mayonesa cremosa, lechuga fresca, tomate maduro y cebolla crujiente',
-                'en_desc': 'Our most complete burger with creamy mayonnaise, fresh lettuce, ripe tomato and crispy onion',
-                'price': '8.50',
-                'ingredients': ['Mayonesa', 'Lechuga', 'Tomate', 'Cebolla']
-            },
-            {
-                'category': 'Hamburguesas',
-                'es_name': 'Burger a la Barbacoa',
-                'en_name': 'BBQ Burger',
-                'es_desc': 'Espectacular hamburguesa de ternera con salsa BBQ, bacon con huevo, lechuga, cebolla crujiente, tomate y sorprendente inyección de queso cheddar',
-                'en_desc': 'Spectacular beef burger with BBQ sauce, bacon with egg, lettuce, crispy onion, tomato and surprising cheddar cheese injection',
-                'price': '7.00',
-                'ingredients': ['Hamburguesa de ternera', 'BBQ', 'Bacon con huevo', 'Lechuga', 'Cebolla crujiente', 'Tomate', 'Inyección de queso cheddar']
-            },
-
-            # MONTADITOS (Todos llevan mayonesa, lechuga y tomate)
-            {
-                'category': 'Montaditos',
-                'es_name': 'Montadito de Cinta de Lomo',
-                'en_name': 'Pork Loin Small Sandwich',
-                'es_desc': 'Sabroso montadito de cinta de lomo con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Tasty pork loin small sandwich with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Cinta de lomo', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Montaditos',
-                'es_name': 'Montadito de Filete de Pollo',
-                'en_name': 'Chicken Fillet Small Sandwich',
-                'es_desc': 'Jugoso montadito de filete de pollo con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Juicy chicken fillet small sandwich with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Filete de pollo', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Montaditos',
-                'es_name': 'Montadito de Lomo Adobado',
-                'en_name': 'Marinated Loin Small Sandwich',
-                'es_desc': 'Delicioso montadito de lomo adobado con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Delicious marinated pork loin small sandwich with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Lomo adobado', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-
-            # CAMPEROS (Todos llevan mayonesa, lechuga y tomate)
-            {
-                'category': 'Camperos',
-                'es_name': 'Campero Mixto',
-                'en_name': 'Mixed Campero',
-                'es_desc': 'Campero mixto en pan especial con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Mixed campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Mixto', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Camperos',
-                'es_name': 'Campero de Filete de Pollo',
-                'en_name': 'Chicken Fillet Campero',
-                'es_desc': 'Campero de filete de pollo en pan especial con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Chicken fillet campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Filete de pollo', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Camperos',
-                'es_name': 'Campero de Pollo Asado',
-                'en_name': 'Roasted Chicken Campero',
-                'es_desc': 'Campero de jugoso pollo asado en pan especial con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Juicy roasted chicken campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Pollo asado', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Camperos',
-                'es_name': 'Campero de Cinta de Lomo',
-                'en_name': 'Pork Loin Campero',
-                'es_desc': 'Campero de cinta de lomo en pan especial con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Pork loin campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Cinta de lomo', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Camperos',
-                'es_name': 'Campero de Kebab',
-                'en_name': 'Kebab Campero',
-                'es_desc': 'Campero de sabrosa carne de kebab en pan especial con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Tasty kebab meat campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '5.00',
-                'ingredients': ['Carne de kebab', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Camperos',
-                'es_name': 'Campero de Bacon',
-                'en_name': 'Bacon Campero',
-                'es_desc': 'Campero de crujiente bacon en pan especial con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Crispy bacon campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Bacon', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Camperos',
-                'es_name': 'Campero de Atún',
-                'en_name': 'Tuna Campero',
-                'es_desc': 'Campero de atún en pan especial con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Tuna campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '5.00',
-                'ingredients': ['Atún', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-            {
-                'category': 'Camperos',
-                'es_name': 'Campero de Huevo',
-                'en_name': 'Egg Campero',
-                'es_desc': 'Campero de huevo en pan especial con mayonesa cremosa, lechuga fresca y tomate',
-                'en_desc': 'Egg campero on special bread with creamy mayonnaise, fresh lettuce and tomato',
-                'price': '4.50',
-                'ingredients': ['Huevo', 'Mayonesa', 'Lechuga', 'Tomate']
-            },
-
-            # SERRANITOS
-            {
-                'category': 'Serranitos',
-                'es_name': 'Serranito de Pollo',
-                'en_name': 'Chicken Serranito',
-                'es_desc': 'Tradicional serranito andaluz con jugoso filete de pollo, jamón serrano, pimiento frito y tu elección de alioli o mayonesa',
-                'en_desc': 'Traditional Andalusian serranito with juicy chicken fillet, serrano ham, fried pepper and your choice of aioli or mayonnaise',
-                'price': '5.00',
-                'ingredients': ['Filete de pollo', 'Jamón serrano', 'Pimiento', 'Alioli', 'Mayonesa']
-            },
-            {
-                'category': 'Serranitos',
-                'es_name': 'Serranito de Lomo',
-                'en_name': 'Pork Loin Serranito',
-                'es_desc': 'Tradicional serranito andaluz con sabrosa cinta de lomo, jamón serrano, pimiento frito y tu elección de alioli o mayonesa',
-                'en_desc': 'Traditional Andalusian serranito with tasty pork loin, serrano ham, fried pepper and your choice of aioli or mayonnaise',
-                'price': '5.00',
-                'ingredients': ['Cinta de lomo', 'Jamón serrano', 'Pimiento', 'Alioli', 'Mayonesa']
-            },
-
-            # COMBINADOS
-            {
-                'category': 'Combinados',
-                'es_name': 'Combinado de Kebab',
-                'en_name': 'Kebab Combo',
-                'es_desc': 'Completo plato combinado con torta de trigo, jugosa carne de kebab, lechuga, tomate, cebolla y crujientes patatas fritas. Incluye tu elección de salsa: yogurt, barbacoa, césar o brava',
-                'en_desc': 'Complete combo plate with wheat tortilla, juicy kebab meat, lettuce, tomato, onion and crispy french fries. Includes your choice of sauce: yogurt, BBQ, caesar or spicy',
-                'price': '9.00',
-                'ingredients': ['Torta de trigo', 'Carne de kebab', 'Lechuga', 'Tomate', 'Cebolla', 'Patatas fritas', 'Salsa de yogurt', 'Salsa barbacoa', 'Salsa césar', 'Salsa brava']
-            },
-            {
-                'category': 'Combinados',
-                'es_name': 'Combinado de Pollo Asado',
-                'en_name': 'Roasted Chicken Combo',
-                'es_desc': 'Completo plato combinado con torta de trigo, jugoso pollo asado, lechuga, tomate, cebolla y crujientes patatas fritas. Incluye tu elección de salsa: yogurt, barbacoa, césar o brava',
-                'en_desc': 'Complete combo plate with wheat tortilla, juicy roasted chicken, lettuce, tomato, onion and crispy french fries. Includes your choice of sauce: yogurt, BBQ, caesar or spicy',
-                'price': '9.00',
-                'ingredients': ['Torta de trigo', 'Pollo asado', 'Lechuga', 'Tomate', 'Cebolla', 'Patatas fritas', 'Salsa de yogurt', 'Salsa barbacoa', 'Salsa césar', 'Salsa brava']
-            },
-        ]
-
-        for prod_data in products_data:
-            product = Product.objects.create(
-                price=Decimal(prod_data['price']),
+        # Pass 1: product rows and their ES/EN translations
+        products = self._insert(Product, [
+            Product(
+                price=prod_data['price'],
                 stock=100,
                 available=True
             )
+            for prod_data in PRODUCTS_DATA
+        ])
+
+        self._insert(ProductTranslation, [
+            ProductTranslation(
+                master_id=product.pk,
+                language_code=lang,
+                name=prod_data[f'{lang}_name'],
+                description=prod_data[f'{lang}_desc'],
+            )
+            for product, prod_data in zip(products, PRODUCTS_DATA)
+            for lang in ('es', 'en')
+        ])
+
+        # Pass 2: category and ingredient links of the created rows
+        CategoryLink = Product.categories.through
+        IngredientLink = Product.ingredients.through
+        category_links = []
+        ingredient_links = []
+        total = len(PRODUCTS_DATA)
+        for i, (product, prod_data) in enumerate(zip(products, PRODUCTS_DATA), 1):
+            category_links.append(CategoryLink(
+                product_id=product.pk,
+                category_id=categories[prod_data['category_idx']].pk,
+            ))
+            ingredient_links.extend(
+                IngredientLink(product_id=product.pk, ingredient_id=ing_id)
+                for ing_id in get_ing_ids(prod_data['ingredients'])
+            )
+            if i % PROGRESS_EVERY == 0:
+                self.stdout.write(f'  ... {i}/{total}')
 
-            # Set translations
-            product.set_current_language('es')
-            product.name = prod_data['es_name']
-            product.description = prod_data['es_desc']
-            product.set_current_language('en')
-            product.name = prod_data['en_name']
-            product.description = prod_data['en_desc']
-            product.save()
-
-            # Set category
-            category = categories[prod_data['category']]
-            product.categories.add(category)
-
-            # Set ingredients
-            ing_objects = get_ing_ids(prod_data['ingredients'])
-            if ing_objects:
-                product.ingredients.set(ing_objects)
-
-            self.stdout.write(f'  ✓ Created product: {prod_data["es_name"]}')
+        self._bulk_create(CategoryLink, category_links, ignore_conflicts=True)
+        self._bulk_create(IngredientLink, ingredient_links, ignore_conflicts=True)
 
-        self.stdout.write(f'  ✓ Created {len(products_data)} products')
+        self.stdout.write(f'  ✓ Created {total} products')
@@ -5,14 +5,91 @@ with sample categories, ingredients, and products in both Spanish and English
 for demonstration and testing purposes.
 """
 
-from typing import List
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Dict, List
 
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from apps.categories.models import Category
-from apps.ingredients.models import Ingredients
-from apps.products.models import Products
+from apps.ingredients.models import Ingredient
+from apps.products.models import Product
+
+
+# Default rows per INSERT for every bulk_create (override with --batch-size)
+BULK_BATCH_SIZE = 500
+
+# Demo products, defined once at import time. Entries are read-only.
+PRODUCTS_DATA = (
+    MappingProxyType({
+        "translations": {
+            "es": {
+                "name": "Bruschetta",
+                "description": "Pan con tomate y albahaca",
+            },
+            "en": {
+                "name": "Bruschetta",
+                "description": "Bread with tomato and basil",
+            },
+        },
+        "price": Decimal("6.50"),
+        "stock": 100,
+        "available": True,
+        "categories": ("Entradas",),
+        "ingredients": ("Tomate", "Albahaca"),
+    }),
+    MappingProxyType({
+        "translations": {
+            "es": {
+                "name": "Pizza Margarita",
+                "description": "Queso y albahaca",
+            },
+            "en": {
+                "name": "Margherita Pizza",
+                "description": "Cheese and basil",
+            },
+        },
+        "price": Decimal("12.00"),
+        "stock": 50,
+        "available": True,
+        "categories": ("Productos principales",),
+        "ingredients": ("Tomate", "Queso", "Albahaca"),
+    }),
+    MappingProxyType({
+        "translations": {
+            "es": {
+                "name": "Tiramisú",
+                "description": "Clásico italiano",
+            },
+            "en": {
+                "name": "Tiramisu",
+                "description": "Italian classic",
+            },
+        },
+        "price": Decimal("7.50"),
+        "stock": 40,
+        "available": True,
+        "categories": ("Postres",),
+        "ingredients": (),
+    }),
+)
+
+
+def _name_index(qs, lang: str = 'es') -> Dict[str, int]:
+    """Map the ``lang`` translated name of every row in ``qs`` to its id.
+
+    Args:
+        qs: Queryset of a translatable model with a translated ``name``.
+        lang: Language code of the names used as keys. Defaults to 'es'.
+
+    Returns:
+        Dict[str, int]: Translated name -> primary key, built in one query.
+    """
+    return dict(
+        qs.filter(translations__language_code=lang)
+        .values_list('translations__name', 'id')
+    )
 
 
 class Command(BaseCommand):
@@ -32,6 +109,7 @@ class Command(BaseCommand):
     Usage:
         Basic usage:
             python manage.py seed_demo
+            python manage.py seed_demo --batch-size 100
 
         From another management command:
             from django.core.management import call_command
@@ -48,10 +126,11 @@ class Command(BaseCommand):
 
     Notes:
         - All operations run within a transaction (atomic)
-        - Creates new records each time (does not check for duplicates)
+        - Records are matched on their Spanish name and reused if present
         - Supports multi-language content (ES/EN)
         - Products are automatically linked to categories and ingredients
-        - Safe to run multiple times (will create duplicate records)
+        - Safe to run multiple times (existing products get price, stock
+          and availability refreshed; no duplicates are created)
 
     Attributes:
         help (str): Short description displayed in management command help.
@@ -59,6 +138,19 @@ class Command(BaseCommand):
 
     help = "Populate demo data: categories -> ingredients -> products (ES/EN)."
 
+    def add_arguments(self, parser) -> None:
+        """Register command line options.
+
+        Args:
+            parser: Argument parser provided by BaseCommand.
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BULK_BATCH_SIZE,
+            help=f"Rows per INSERT statement (default: {BULK_BATCH_SIZE})",
+        )
+
     @transaction.atomic
     def handle(self, *args, **options) -> None:
         """Execute the command to seed demo data.
@@ -69,7 +161,8 @@ class Command(BaseCommand):
 
         Args:
             *args: Variable length argument list (unused).
-            **options: Arbitrary keyword arguments from command line options.
+            **options: Command line options; ``batch_size`` sets the rows
+                per INSERT for every bulk_create.
 
         Returns:
             None
@@ -78,6 +171,7 @@ class Command(BaseCommand):
             Runs within a database transaction to ensure atomicity.
             If any step fails, all changes are rolled back.
         """
+        self.batch_size = options["batch_size"]
         self.stdout.write(self.style.MIGRATE_HEADING("Seeding demo data..."))
 
         categories = self._seed_categories()
@@ -90,7 +184,15 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"Created/ensured {len(ingredients)} ingredients")
         )
 
-        products = self._seed_products(categories, ingredients)
+        # Spanish name -> id lookups, built once and shared by the loaders
+        self._cat_index = _name_index(
+            Category.objects.filter(pk__in=[c.pk for c in categories])
+        )
+        self._ing_index = _name_index(
+            Ingredient.objects.filter(pk__in=[i.pk for i in ingredients])
+        )
+
+        products = self._seed_products()
         self.stdout.write(
             self.style.SUCCESS(f"Created/ensured {len(products)} products")
         )
@@ -106,9 +208,10 @@ class Command(BaseCommand):
         - Desserts/Postres
 
         Each category is created with translations in both Spanish and English.
+        Categories that already exist (same Spanish name) are reused.
 
         Returns:
-            List[Category]: List of created Category objects.
+            List[Category]: List of created or existing Category objects.
 
         Example:
             >>> categories = self._seed_categories()
@@ -117,7 +220,6 @@ class Command(BaseCommand):
             >>> categories[0].safe_translation_getter('name', language_code='en')
             'Starters'
         """
-        created = []
         data = [
             {
                 "es": {"name": "Entradas", "description": "Productos para iniciar"},
@@ -132,20 +234,9 @@ class Command(BaseCommand):
                 "en": {"name": "Desserts", "description": "Sweet endings"},
             },
         ]
-        for item in data:
-            obj = Category.objects.create()
-            obj.set_current_language('es')
-            obj.name = item["es"]["name"]
-            obj.description = item["es"].get("description")
-            obj.save()
-            obj.set_current_language('en')
-            obj.name = item["en"]["name"]
-            obj.description = item["en"].get("description")
-            obj.save()
-            created.append(obj)
-        return created
+        return self._ensure_translated(Category, [({}, item) for item in data])
 
-    def _seed_ingredients(self) -> List[Ingredients]:
+    def _seed_ingredients(self) -> List[Ingredient]:
         """Create demo ingredients with Spanish and English translations.
 
         Creates three predefined ingredients commonly used in menu items:
@@ -154,9 +245,10 @@ class Command(BaseCommand):
         - Basil/Albahaca
 
         Each ingredient is created with translations in both Spanish and English.
+        Ingredients that already exist (same Spanish name) are reused.
 
         Returns:
-            List[Ingredients]: List of created Ingredients objects.
+            List[Ingredient]: List of created or existing Ingredient objects.
 
         Example:
             >>> ingredients = self._seed_ingredients()
@@ -165,26 +257,14 @@ class Command(BaseCommand):
             >>> ingredients[0].safe_translation_getter('name', language_code='es')
             'Tomate'
         """
-        created = []
         data = [
             {"es": {"name": "Tomate"}, "en": {"name": "Tomato"}},
             {"es": {"name": "Queso"}, "en": {"name": "Cheese"}},
             {"es": {"name": "Albahaca"}, "en": {"name": "Basil"}},
         ]
-        for item in data:
-            obj = Ingredients.objects.create()
-            obj.set_current_language('es')
-            obj.name = item["es"]["name"]
-            obj.save()
-            obj.set_current_language('en')
-            obj.name = item["en"]["name"]
-            obj.save()
-            created.append(obj)
-        return created
+        return self._ensure_translated(Ingredient, [({}, item) for item in data])
 
-    def _seed_products(
-        self, categories: List[Category], ingredients: List[Ingredients]
-    ) -> List[Products]:
+    def _seed_products(self) -> List[Product]:
         """Create demo products with translations and associations.
 
         Creates three sample products with complete details:
@@ -197,15 +277,14 @@ class Command(BaseCommand):
         - Price, stock quantity, and availability status
         - Associated categories and ingredients
 
-        Args:
-            categories: List of Category objects to associate with products.
-            ingredients: List of Ingredients objects to associate with products.
+        Categories and ingredients are resolved through ``self._cat_index``
+        and ``self._ing_index``, built by handle() after they are seeded.
 
         Returns:
-            List[Products]: List of created Products objects.
+            List[Product]: List of created or updated Product objects.
 
         Example:
-            >>> products = self._seed_products(categories, ingredients)
+            >>> products = self._seed_products()
             >>> len(products)
             3
             >>> products[0].price
@@ -214,101 +293,112 @@ class Command(BaseCommand):
             'Bruschetta'
 
         Note:
-            - Products are linked to categories and ingredients via ManyToMany
-            - Category and ingredient lookups use safe_translation_getter
+            - Products already present (same Spanish name) are updated in place;
+              new products and missing translations use one bulk_create each
+            - Products are linked to categories and ingredients via ManyToMany,
+              inserted with one bulk_create per through table
+            - Category and ingredient lookups match on the Spanish name
             - All products are created with available=True
         """
-        created = []
-        # Simple mapping helpers for category and ingredient lookups
-        cat_by_name = {
-            c.safe_translation_getter('name', any_language=True): c
-            for c in categories
-        }
-        ing_by_name = {
-            i.safe_translation_getter('name', any_language=True): i
-            for i in ingredients
-        }
-
-        data = [
-            {
-                "translations": {
-                    "es": {
-                        "name": "Bruschetta",
-                        "description": "Pan con tomate y albahaca",
-                    },
-                    "en": {
-                        "name": "Bruschetta",
-                        "description": "Bread with tomato and basil",
-                    },
-                },
-                "price": 6.50,
-                "stock": 100,
-                "available": True,
-                "categories": ["Entradas"],
-                "ingredients": ["Tomate", "Albahaca"],
-            },
-            {
-                "translations": {
-                    "es": {
-                        "name": "Pizza Margarita",
-                        "description": "Queso y albahaca",
-                    },
-                    "en": {
-                        "name": "Margherita Pizza",
-                        "description": "Cheese and basil",
-                    },
-                },
-                "price": 12.00,
-                "stock": 50,
-                "available": True,
-                "categories": ["Productos principales"],
-                "ingredients": ["Tomate", "Queso", "Albahaca"],
-            },
-            {
-                "translations": {
-                    "es": {
-                        "name": "Tiramisú",
-                        "description": "Clásico italiano",
+        created = self._ensure_translated(
+            Product,
+            [
+                (
+                    {
+                        "price": item["price"],
+                        "stock": item["stock"],
+                        "available": item["available"],
                     },
-                    "en": {
-                        "name": "Tiramisu",
-                        "description": "Italian classic",
-                    },
-                },
-                "price": 7.50,
-                "stock": 40,
-                "available": True,
-                "categories": ["Postres"],
-                "ingredients": [],
-            },
-        ]
-
-        for item in data:
-            p = Products.objects.create(
-                price=item["price"],
-                stock=item["stock"],
-                available=item["available"]
-            )
-            p.set_current_language('es')
-            p.name = item["translations"]["es"]["name"]
-            p.description = item["translations"]["es"].get("description")
-            p.save()
-            p.set_current_language('en')
-            p.name = item["translations"]["en"]["name"]
-            p.description = item["translations"]["en"].get("description")
-            p.save()
+                    item["translations"],
+                )
+                for item in PRODUCTS_DATA
+            ],
+            update_fields=("price", "stock", "available"),
+        )
 
+        # Relationship rows are collected and inserted once per M2M table
+        CategoryLink = Product.categories.through
+        IngredientLink = Product.ingredients.through
+        category_links = []
+        ingredient_links = []
+        for p, item in zip(created, PRODUCTS_DATA):
             for cat_name in item["categories"]:
-                c = cat_by_name.get(cat_name)
-                if c:
-                    p.categories.add(c)
+                category_id = self._cat_index.get(cat_name)
+                if category_id:
+                    category_links.append(
+                        CategoryLink(product_id=p.pk, category_id=category_id)
+                    )
             for ing_name in item["ingredients"]:
-                ing = ing_by_name.get(ing_name)
-                if ing:
-                    p.ingredients.add(ing)
-            created.append(p)
+                ingredient_id = self._ing_index.get(ing_name)
+                if ingredient_id:
+                    ingredient_links.append(
+                        IngredientLink(product_id=p.pk, ingredient_id=ingredient_id)
+                    )
+
+        CategoryLink.objects.bulk_create(
+            category_links, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        IngredientLink.objects.bulk_create(
+            ingredient_links, batch_size=self.batch_size, ignore_conflicts=True
+        )
         return created
 
+    def _ensure_translated(self, model, rows, update_fields=()):
+        """Return one instance per row, creating only the missing ones.
+
+        Rows are matched against the database on their Spanish name, so
+        running the command again reuses the records it created before.
+        New instances are inserted with one bulk_create, existing ones get
+        ``update_fields`` refreshed with one bulk_update, and any missing
+        ES/EN translation is added with ``ignore_conflicts``.
+
+        Args:
+            model: Translatable model to seed (Category, Ingredient, Product).
+            rows: ``(fields, translations)`` pairs, where ``translations``
+                maps a language code to that language's translated values.
+            update_fields: Model fields refreshed on rows that already exist.
+
+        Returns:
+            List of model instances in the same order as ``rows``.
+        """
+        Translation = model._parler_meta.root_model
+        existing_ids = dict(
+            model.objects.filter(
+                translations__language_code='es',
+                translations__name__in=[trans["es"]["name"] for _, trans in rows],
+            ).values_list('translations__name', 'id')
+        )
+        existing = model.objects.in_bulk(existing_ids.values())
+
+        objs, new_objs, stale_objs = [], [], []
+        for fields, trans in rows:
+            pk = existing_ids.get(trans["es"]["name"])
+            if pk is None:
+                obj = model(**fields)
+                new_objs.append(obj)
+            else:
+                obj = existing[pk]
+                for field in update_fields:
+                    setattr(obj, field, fields[field])
+                stale_objs.append(obj)
+            objs.append(obj)
+
+        model.objects.bulk_create(new_objs, batch_size=self.batch_size)
+        if update_fields and stale_objs:
+            model.objects.bulk_update(
+                stale_objs, update_fields, batch_size=self.batch_size
+            )
+        Translation.objects.bulk_create(
+            [
+                Translation(master_id=obj.pk, language_code=lang, **values)
+                for obj, (_, trans) in zip(objs, rows)
+                for lang, values in trans.items()
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        return objs
+
 
 
 
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_product_allow_ingredient_swap'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['available', 'id'], name='product_available_id_idx'),
+        ),
+    ]
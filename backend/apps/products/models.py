@@ -205,6 +205,10 @@ class Product(TranslatableModel):
         db_table = 'products_products'  # Keep old table name for backward compatibility
         verbose_name = "Product"
         verbose_name_plural = "Products"
+        # Menu listings filter on available=True and page by id
+        indexes = [
+            models.Index(fields=['available', 'id'], name='product_available_id_idx'),
+        ]
 
 
 
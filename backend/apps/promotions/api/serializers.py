@@ -1,13 +1,89 @@
 """Promotion serializers for REST API operations."""
 
+from functools import cached_property
+from typing import Any, Dict, Optional
+
 from rest_framework import serializers
 from apps.promotions.models import Promotion, CarouselCard
 
 
-class PromotionSerializer(serializers.ModelSerializer):
+def request_base_uri(context: Dict[str, Any]) -> str:
+    """Return the scheme and host of the context's request, if any.
+
+    Args:
+        context: Serializer context, optionally holding ``request``.
+
+    Returns:
+        str: e.g. ``'https://example.com'`` (no trailing slash), or ``''``
+            when there is no request to build absolute URLs from.
+    """
+    request = context.get('request')
+    if request is None:
+        return ''
+    return request.build_absolute_uri('/').rstrip('/')
+
+
+def absolute_file_url(base_uri: str, value) -> Optional[str]:
+    """Join a stored file's URL onto ``base_uri``.
+
+    Args:
+        base_uri: Result of ``request_base_uri``.
+        value: FieldFile (possibly empty).
+
+    Returns:
+        str: Absolute URL of the file, or None if there is no file.
+    """
+    if not value:
+        return None
+    return absolute_media_url(base_uri, value.url)
+
+
+def absolute_media_url(base_uri: str, url: str) -> str:
+    """Prefix a storage URL with ``base_uri`` unless it is already absolute.
+
+    Args:
+        base_uri: Result of ``request_base_uri``.
+        url: URL returned by the storage backend.
+
+    Returns:
+        str: Absolute URL.
+    """
+    # Remote storages (Cloudinary) already return absolute URLs
+    if url.startswith('/'):
+        return f"{base_uri}{url}"
+    return url
+
+
+class AbsoluteImageField(serializers.ImageField):
+    """Read-only ImageField that renders an absolute URL.
+
+    Behaves like DRF's ``ImageField(use_url=True)``, but the request's
+    scheme and host are resolved once per field instance. With
+    ``many=True`` the same child serializer (and field) renders every row,
+    so the lookup happens once per response instead of once per object.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('read_only', True)
+        kwargs['use_url'] = True
+        super().__init__(**kwargs)
+
+    @cached_property
+    def _base_uri(self) -> str:
+        """Scheme and host of the current request, without trailing slash."""
+        return request_base_uri(self.context)
+
+    def to_representation(self, value) -> Optional[str]:
+        """Return the absolute image URL, or None if there is no image."""
+        return absolute_file_url(self._base_uri, value)
+
+
+class PromotionDetailSerializer(serializers.ModelSerializer):
     """Serializer for Promotion model.
 
     Handles serialization of promotions with image URLs and descriptions.
+    Used for retrieve/create/update; the admin list uses the lighter
+    PromotionAdminListSerializer.
 
     Attributes:
         image_url (str): Read-only absolute URL for the promotion image.
@@ -18,7 +94,7 @@ class PromotionSerializer(serializers.ModelSerializer):
 
     Example:
         >>> promotion = Promotion.objects.get(id=1)
-        >>> serializer = PromotionSerializer(promotion, context={'request': request})
+        >>> serializer = PromotionDetailSerializer(promotion, context={'request': request})
         >>> serializer.data
         {
             'id': 1,
@@ -37,7 +113,7 @@ class PromotionSerializer(serializers.ModelSerializer):
         - Requires request in context to build absolute URLs
     """
 
-    image_url = serializers.SerializerMethodField()
+    image_url = AbsoluteImageField(source='image')
 
     class Meta:
         model = Promotion
@@ -54,25 +130,42 @@ class PromotionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ('created_at', 'updated_at')
 
-    def get_image_url(self, obj: Promotion) -> str:
-        """Get absolute URL for promotion image.
 
-        Args:
-            obj: Promotion instance.
+class PromotionAdminListSerializer(serializers.ModelSerializer):
+    """Serializer for the admin promotions list.
 
-        Returns:
-            str: Absolute URL for the image or None if no image.
+    Includes what the admin list view displays and toggles, leaving out the
+    raw ``image`` path and the timestamps that only the detail view needs.
 
-        Example:
-            >>> serializer.get_image_url(promotion)
-            'https://example.com/media/promotions/summer_sale.jpg'
-        """
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
-        return None
+    Example:
+        >>> promotions = Promotion.objects.all()
+        >>> serializer = PromotionAdminListSerializer(promotions, many=True, context={'request': request})
+        >>> serializer.data
+        [
+            {
+                'id': 1,
+                'title': 'Summer Sale',
+                'description': '50% off all pizzas!',
+                'image_url': 'https://example.com/media/promotions/summer_sale.jpg',
+                'is_active': True,
+                'order': 1
+            },
+            ...
+        ]
+    """
+
+    image_url = AbsoluteImageField(source='image')
+
+    class Meta:
+        model = Promotion
+        fields = [
+            'id',
+            'title',
+            'description',
+            'image_url',
+            'is_active',
+            'order'
+        ]
 
 
 class PromotionListSerializer(serializers.ModelSerializer):
@@ -103,9 +196,11 @@ class PromotionListSerializer(serializers.ModelSerializer):
         - Used for public API endpoint
         - Only shows active promotions
         - Minimal data transfer for performance
+        - The ``active`` view builds the same shape from ``.values()`` rows;
+          this serializer documents it in the API schema
     """
 
-    image_url = serializers.SerializerMethodField()
+    image_url = AbsoluteImageField(source='image')
 
     class Meta:
         model = Promotion
@@ -116,22 +211,6 @@ class PromotionListSerializer(serializers.ModelSerializer):
             'order'
         ]
 
-    def get_image_url(self, obj: Promotion) -> str:
-        """Get absolute URL for promotion image.
-
-        Args:
-            obj: Promotion instance.
-
-        Returns:
-            str: Absolute URL for the image or None if no image.
-        """
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
-        return None
-
 
 class CarouselCardSerializer(serializers.ModelSerializer):
     """Serializer for CarouselCard model.
@@ -1,5 +1,15 @@
 """Promotions API views module."""
 
+import os
+import time
+from typing import Callable
+
+import orjson
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
@@ -7,35 +17,68 @@ from rest_framework.response import Response
 from rest_framework.request import Request
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from apps.promotions.cache import (
+    ACTIVE_CACHE_TIMEOUT,
+    ACTIVE_PROMOTIONS_KEY,
+    active_carousel_cards_payload,
+    content_etag,
+    active_carousel_cards_snapshot_path,
+    write_active_carousel_cards_snapshot,
+)
 from apps.promotions.models import Promotion, CarouselCard
-from apps.promotions.api.serializers import PromotionSerializer, PromotionListSerializer, CarouselCardSerializer
+from apps.promotions.api.serializers import (
+    PromotionAdminListSerializer,
+    PromotionDetailSerializer,
+    PromotionListSerializer,
+    CarouselCardSerializer,
+    absolute_media_url,
+)
+
+
+def etag_response(
+    request: Request, tag: str, build: Callable[[], HttpResponse]
+) -> HttpResponse:
+    """Answer a conditional GET for content whose ETag is already known.
+
+    Args:
+        request: HTTP request, possibly carrying If-None-Match.
+        tag: Quoted ETag of the body ``build`` would return.
+        build: Builds the full response; only called when the client's
+            copy is stale.
+
+    Returns:
+        HttpResponse: 304 Not Modified or the built response, with ETag set.
+    """
+    response = get_conditional_response(request, etag=tag) or build()
+    response.headers['ETag'] = tag
+    return response
 
 
 @extend_schema_view(
     list=extend_schema(
         tags=['promotions'],
         description="List all promotions (admin only)",
-        responses={200: PromotionSerializer(many=True)},
+        responses={200: PromotionAdminListSerializer(many=True)},
     ),
     retrieve=extend_schema(
         tags=['promotions'],
         description="Get promotion details (admin only)",
-        responses={200: PromotionSerializer},
+        responses={200: PromotionDetailSerializer},
     ),
     create=extend_schema(
         tags=['promotions'],
         description="Create new promotion (admin only)",
-        responses={201: PromotionSerializer},
+        responses={201: PromotionDetailSerializer},
     ),
     update=extend_schema(
         tags=['promotions'],
         description="Update promotion (admin only)",
-        responses={200: PromotionSerializer},
+        responses={200: PromotionDetailSerializer},
     ),
     partial_update=extend_schema(
         tags=['promotions'],
         description="Partially update promotion (admin only)",
-        responses={200: PromotionSerializer},
+        responses={200: PromotionDetailSerializer},
     ),
     destroy=extend_schema(
         tags=['promotions'],
@@ -55,7 +98,8 @@ class PromotionViewSet(viewsets.ModelViewSet):
 
     Attributes:
         queryset: All promotions ordered by display order.
-        serializer_class: PromotionSerializer for all operations.
+        serializer_class: PromotionDetailSerializer for detail and write
+            operations; the list action uses PromotionAdminListSerializer.
 
     Example:
         >>> # List all promotions (admin)
@@ -76,7 +120,7 @@ class PromotionViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Promotion.objects.all()
-    serializer_class = PromotionSerializer
+    serializer_class = PromotionDetailSerializer
     pagination_class = None  # Disable pagination for this ViewSet
 
     def get_permissions(self):
@@ -93,12 +137,24 @@ class PromotionViewSet(viewsets.ModelViewSet):
             return [AllowAny()]
         return [IsAdminUser()]
 
+    def get_serializer_class(self):
+        """Use the trimmed list serializer for the admin list.
+
+        Returns:
+            type: PromotionAdminListSerializer for 'list', otherwise
+                PromotionDetailSerializer.
+        """
+        if self.action == 'list':
+            return PromotionAdminListSerializer
+        return PromotionDetailSerializer
+
     @extend_schema(
         tags=['promotions'],
         description="Get all active promotions for display (public endpoint)",
         responses={200: PromotionListSerializer(many=True)},
     )
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @method_decorator(cache_control(public=True, max_age=60))
     def active(self, request: Request) -> Response:
         """Get all active promotions.
 
@@ -127,14 +183,41 @@ class PromotionViewSet(viewsets.ModelViewSet):
             - No authentication required
             - Only returns active promotions (is_active=True)
             - Ordered by 'order' field (ascending)
+            - Sends an ETag and Cache-Control (60s); conditional requests
+              with a matching If-None-Match get a 304
+            - The serialized payload is cached server-side together with its
+              ETag, so a cache hit does no query and the tag always matches
+              the body; entries are dropped by the post_save/post_delete
+              handlers in apps.promotions.signals
         """
-        active_promotions = self.queryset.filter(is_active=True)
-        serializer = PromotionListSerializer(
-            active_promotions,
-            many=True,
-            context={'request': request}
+        # Image URLs are absolute, so payloads are cached per base URI
+        base_uri = request.build_absolute_uri('/')
+        payloads = cache.get(ACTIVE_PROMOTIONS_KEY) or {}
+        entry = payloads.get(base_uri)
+        if entry is None:
+            # Same shape as PromotionListSerializer, built from plain rows
+            storage = Promotion._meta.get_field('image').storage
+            base = base_uri.rstrip('/')
+            data = [
+                {
+                    'id': row['id'],
+                    'description': row['description'],
+                    'image_url': (
+                        absolute_media_url(base, storage.url(row['image']))
+                        if row['image'] else None
+                    ),
+                    'order': row['order'],
+                }
+                for row in self.get_queryset().filter(is_active=True).values(
+                    'id', 'description', 'image', 'order'
+                )
+            ]
+            entry = payloads[base_uri] = (content_etag(orjson.dumps(data)), data)
+            cache.set(ACTIVE_PROMOTIONS_KEY, payloads, ACTIVE_CACHE_TIMEOUT)
+        tag, data = entry
+        return etag_response(
+            request, tag, lambda: Response(data, status=status.HTTP_200_OK)
         )
-        return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 @extend_schema_view(
@@ -225,7 +308,8 @@ class CarouselCardViewSet(viewsets.ModelViewSet):
         responses={200: CarouselCardSerializer(many=True)},
     )
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
-    def active(self, request: Request) -> Response:
+    @method_decorator(cache_control(public=True, max_age=60))
+    def active(self, request: Request) -> HttpResponse:
         """Get all active carousel cards.
 
         Public endpoint that returns only active cards, ordered by
@@ -255,7 +339,31 @@ class CarouselCardViewSet(viewsets.ModelViewSet):
             - No authentication required
             - Only returns active cards (is_active=True)
             - Ordered by 'order' field (ascending)
+            - Sends an ETag and Cache-Control (60s); conditional requests
+              with a matching If-None-Match get a 304
+            - The payload is materialized to MEDIA_ROOT/carousel_cards_active.json
+              by the signal handlers in apps.promotions.signals, so a web
+              server or CDN can serve that file without entering Django.
+              Here it is served as-is while younger than
+              ACTIVE_CACHE_TIMEOUT, and regenerated otherwise. The ETag is
+              derived from the bytes sent, so serving the snapshot never
+              touches the database.
         """
-        active_cards = self.queryset.filter(is_active=True)
-        serializer = CarouselCardSerializer(active_cards, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        snapshot = active_carousel_cards_snapshot_path()
+        body = None
+        try:
+            if time.time() - os.path.getmtime(snapshot) < ACTIVE_CACHE_TIMEOUT:
+                with open(snapshot, 'rb') as f:
+                    body = f.read()
+        except OSError:
+            pass
+        if body is None:
+            body = render_active_carousel_cards()
+            try:
+                write_active_carousel_cards_snapshot(body)
+            except OSError:
+                pass  # Read-only media storage: keep serving from the database
+        return etag_response(
+            request, content_etag(body),
+            lambda: HttpResponse(body, content_type='application/json'),
+        )
@@ -9,3 +9,7 @@ class PromotionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.promotions'
     verbose_name = 'Promotions'
+
+    def ready(self):
+        """Import signal handlers when the app is ready."""
+        import apps.promotions.signals
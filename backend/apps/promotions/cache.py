@@ -0,0 +1,103 @@
+"""Cache keys and snapshots for the public promotions endpoints.
+
+The promotions ``active`` endpoint stores its serialized payload, together
+with the ETag derived from it, under a cache key; the carousel cards ``active`` endpoint is materialized as a
+static JSON snapshot under ``MEDIA_ROOT`` that can be served directly.
+Signal handlers in ``apps.promotions.signals`` drop the cache key and
+rewrite the snapshot whenever a promotion or carousel card changes.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+from core.renderers import ORJSONRenderer
+
+ACTIVE_PROMOTIONS_KEY = 'promotions:active:v2'  # v2: (etag, payload) entries
+
+# Upper bound on staleness for processes that miss an invalidation
+# (e.g. per-process LocMemCache when Redis is not configured).
+ACTIVE_CACHE_TIMEOUT = 300
+
+ACTIVE_CAROUSEL_CARDS_SNAPSHOT = 'carousel_cards_active.json'
+
+# Columns of the public carousel payload (timestamps are admin-only)
+ACTIVE_CAROUSEL_CARD_FIELDS = (
+    'id', 'text', 'emoji', 'background_color', 'is_active', 'order',
+)
+
+
+def content_etag(body: bytes) -> str:
+    """Return a quoted strong ETag derived from a response body.
+
+    Args:
+        body: Exact bytes sent to the client.
+
+    Returns:
+        str: e.g. ``'"5d41402abc4b2a76b9719d911017c592"'``.
+    """
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def active_carousel_cards_payload() -> List[Dict[str, Any]]:
+    """Return the active carousel cards as plain dicts, in display order."""
+    from apps.promotions.models import CarouselCard
+
+    return list(
+        CarouselCard.objects.filter(is_active=True)
+        .values(*ACTIVE_CAROUSEL_CARD_FIELDS)
+    )
+
+
+def active_carousel_cards_snapshot_path() -> str:
+    """Return the filesystem path of the active carousel cards snapshot."""
+    return os.path.join(settings.MEDIA_ROOT, ACTIVE_CAROUSEL_CARDS_SNAPSHOT)
+
+
+def render_active_carousel_cards(data: Optional[List[Any]] = None) -> bytes:
+    """Render the active carousel cards exactly as the API renderer would.
+
+    Args:
+        data: Already built payload. Built with
+            ``active_carousel_cards_payload`` when None.
+
+    Returns:
+        bytes: JSON body, identical to the project's default renderer output.
+    """
+    if data is None:
+        data = active_carousel_cards_payload()
+    return ORJSONRenderer().render(data)
+
+
+def write_active_carousel_cards_snapshot(body: Optional[bytes] = None) -> bytes:
+    """Write the active carousel cards to the static JSON snapshot.
+
+    The file is written to a temporary name and swapped in with
+    ``os.replace``, so readers never see a partially written snapshot.
+
+    Args:
+        body: Already rendered payload. Rendered with
+            ``render_active_carousel_cards`` when None.
+
+    Returns:
+        bytes: The JSON body that was written.
+    """
+    if body is None:
+        body = render_active_carousel_cards()
+
+    path = active_carousel_cards_snapshot_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(body)
+        # mkstemp creates the file 0600; the web server must be able to read it
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return body
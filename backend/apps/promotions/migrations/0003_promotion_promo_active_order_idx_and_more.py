@@ -0,0 +1,21 @@
+# Generated by Django 5.2.3 on 2026-10-15 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promotions', '0002_carouselcard'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='promotion',
+            index=models.Index(fields=['is_active', 'order', '-created_at'], name='promo_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='carouselcard',
+            index=models.Index(fields=['is_active', 'order', '-created_at'], name='carousel_active_order_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-15 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promotions', '0003_promotion_promo_active_order_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='promotion',
+            name='promo_active_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='carouselcard',
+            name='carousel_active_order_idx',
+        ),
+        migrations.AddIndex(
+            model_name='promotion',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', '-created_at'], name='promo_active_partial_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='carouselcard',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', '-created_at'], name='carousel_active_partial_idx'),
+        ),
+    ]
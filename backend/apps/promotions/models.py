@@ -75,6 +75,15 @@ class Promotion(models.Model):
         ordering = ['order', '-created_at']
         verbose_name = 'Promotion'
         verbose_name_plural = 'Promotions'
+        # Public active() lists: partial index holding only active rows,
+        # already sorted by the model ordering
+        indexes = [
+            models.Index(
+                fields=['order', '-created_at'],
+                condition=models.Q(is_active=True),
+                name='promo_active_partial_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         """Return string representation of the promotion.
@@ -157,6 +166,15 @@ class CarouselCard(models.Model):
         ordering = ['order', '-created_at']
         verbose_name = 'Carousel Card'
         verbose_name_plural = 'Carousel Cards'
+        # Public active() lists: partial index holding only active rows,
+        # already sorted by the model ordering
+        indexes = [
+            models.Index(
+                fields=['order', '-created_at'],
+                condition=models.Q(is_active=True),
+                name='carousel_active_partial_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         """Return string representation of the carousel card.
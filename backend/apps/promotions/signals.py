@@ -0,0 +1,51 @@
+"""
+Promotion signals for cache invalidation.
+
+Drops the cached ``active`` promotions payload and rewrites the active
+carousel cards snapshot whenever a promotion or carousel card is created,
+updated, or deleted, so the public endpoints never serve stale content
+after an admin change.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .cache import ACTIVE_PROMOTIONS_KEY, write_active_carousel_cards_snapshot
+from .models import Promotion, CarouselCard
+
+
+@receiver(post_save, sender=Promotion)
+@receiver(post_delete, sender=Promotion)
+def invalidate_active_promotions(sender, instance, **kwargs):
+    """Delete the cached active promotions payload once the change commits.
+
+    Deleting inside the transaction would let a concurrent request re-cache
+    the pre-commit rows for up to ACTIVE_CACHE_TIMEOUT.
+    """
+    transaction.on_commit(_delete_active_promotions)
+
+
+@receiver(post_save, sender=CarouselCard)
+@receiver(post_delete, sender=CarouselCard)
+def refresh_active_carousel_cards(sender, instance, **kwargs):
+    """Rewrite the active carousel cards snapshot once the change commits."""
+    transaction.on_commit(_write_snapshot)
+
+
+def _delete_active_promotions():
+    """Drop the cached active promotions payload."""
+    cache.delete(ACTIVE_PROMOTIONS_KEY)
+
+
+def _write_snapshot():
+    """Write the snapshot, tolerating read-only media storage.
+
+    A snapshot that cannot be rewritten is ignored by the view once it is
+    older than ACTIVE_CACHE_TIMEOUT, so failing here must not break the
+    admin request that triggered it.
+    """
+    try:
+        write_active_carousel_cards_snapshot()
+    except OSError:
+        pass
@@ -8,12 +8,12 @@ Notes:
     - No models are currently registered in this admin module.
     - User authentication is handled through Django's built-in User model
       or a custom User model defined in apps.users.models.
-    - Custom permission classes are defined in apps.users.permisionsUsers.
+    - Custom permission classes are defined in apps.users.permissions.
     - Future admin customizations for user management can be added here.
 
 See Also:
     - apps.users.models for User model definition
-    - apps.users.permisionsUsers for custom permission classes
+    - apps.users.permissions for custom permission classes
     - Django admin documentation for user management
 """
 
@@ -59,6 +59,10 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
     readonly_fields = ('token', 'created_at', 'expires_at')
     ordering = ('-created_at',)
 
+    def get_queryset(self, request):
+        """Join users so list rows and __str__ don't query per token."""
+        return super().get_queryset(request).with_user()
+
     def token_preview(self, obj):
         """Show first 16 characters of token."""
         return f"{obj.token[:16]}..."
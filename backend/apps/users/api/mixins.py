@@ -0,0 +1,103 @@
+"""Reusable viewset mixins for the users API."""
+
+from typing import List, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+
+
+def relation_lookup(model: type[Model], source: str) -> Tuple[str, bool]:
+    """Resolve the relation part of a serializer field ``source``.
+
+    Walks ``source`` (``'a.b.c'``) across model relations and stops at the
+    first non-relational attribute.
+
+    Args:
+        model: Model the source is resolved against.
+        source: Dotted serializer field source.
+
+    Returns:
+        Tuple of the ORM lookup (``'a__b'``, empty when ``source`` starts on
+        a concrete column) and whether any hop is to-many, i.e. whether it
+        needs ``prefetch_related`` rather than ``select_related``.
+    """
+    parts: List[str] = []
+    many = False
+    for attr in source.split('.'):
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation:
+            break
+        parts.append(attr)
+        many = many or field.many_to_many or field.one_to_many
+        model = field.related_model
+    return '__'.join(parts), many
+
+
+class AutoPrefetchViewSetMixin:
+    """Eager-load the relations rendered by the viewset's serializer.
+
+    The serializer's ``Meta.fields`` are classified once per serializer
+    class into ``select_related`` (forward FK / one-to-one) and
+    ``prefetch_related`` (many-to-many / reverse) lookups. Declared fields
+    are resolved through their ``source``, so nested serializers and dotted
+    sources (``source='groups.name'``) are covered too. Relations read by
+    code the plan cannot see (e.g. a SerializerMethodField) are declared in
+    ``Meta.prefetch_related``. The result is cached on the serializer class,
+    and every queryset returned by ``get_queryset`` is eager-loaded with it,
+    so listing N rows costs a constant number of queries as the serializer
+    grows.
+
+    Viewsets that override ``get_queryset`` should pass their queryset
+    through ``prefetch_for_serializer`` themselves.
+
+    Example:
+        >>> class UsersListViewSet(AutoPrefetchViewSetMixin, viewsets.ModelViewSet):
+        ...     serializer_class = UserListSerializer
+    """
+
+    def get_queryset(self) -> QuerySet:
+        """Return the default queryset with serializer relations eager-loaded."""
+        return self.prefetch_for_serializer(super().get_queryset())
+
+    def prefetch_for_serializer(self, queryset: QuerySet) -> QuerySet:
+        """Apply the serializer's eager-loading plan to ``queryset``.
+
+        Args:
+            queryset: Base queryset of the serializer's model.
+
+        Returns:
+            QuerySet with select_related/prefetch_related applied (unchanged
+            when the serializer renders no relations).
+        """
+        select, prefetch = self._prefetch_plan(self.get_serializer_class())
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+    @staticmethod
+    def _prefetch_plan(serializer_class) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Return (and cache) ``(select_related, prefetch_related)`` names."""
+        plan = serializer_class.__dict__.get('_prefetch_plan')
+        if plan is None:
+            meta = serializer_class.Meta
+            declared = getattr(serializer_class, '_declared_fields', {})
+            select: List[str] = []
+            prefetch: List[str] = list(getattr(meta, 'prefetch_related', ()))
+            for name in getattr(meta, 'fields', ()):
+                source = getattr(declared.get(name), 'source', None) or name
+                if source == '*':
+                    continue
+                lookup, many = relation_lookup(meta.model, source)
+                if not lookup:
+                    continue
+                target = prefetch if many else select
+                if lookup not in target:
+                    target.append(lookup)
+            plan = (tuple(select), tuple(prefetch))
+            serializer_class._prefetch_plan = plan
+        return plan
@@ -0,0 +1,77 @@
+"""Pagination classes for the users API."""
+
+import hashlib
+from functools import partial
+from typing import Any, List, Optional
+
+from django.core.cache import cache
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import QuerySet
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+
+
+class KnownCountPaginator(DjangoPaginator):
+    """Django paginator that can be handed a precomputed ``count``."""
+
+    def __init__(self, object_list, per_page, count: Optional[int] = None, **kwargs: Any):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # Prime the cached_property so no COUNT(*) query is issued
+            self.__dict__['count'] = count
+
+
+class CachedCountPagination(PageNumberPagination):
+    """Page-number pagination that caches the total row count.
+
+    The ``COUNT(*)`` behind ``count``/``next`` is cached per requesting user
+    and search term for ``count_cache_timeout`` seconds. Requests for the
+    first page always recount and refresh the cache, so a client paging
+    from the start sees an up-to-date total.
+
+    Example:
+        >>> class UsersListViewSet(viewsets.ModelViewSet):
+        ...     pagination_class = CachedCountPagination
+    """
+
+    count_cache_timeout = 60
+
+    def get_count_cache_key(self, request: Request) -> str:
+        """Build the cache key for the count of ``request``'s result set.
+
+        Args:
+            request: The list request.
+
+        Returns:
+            Key combining the user id and a digest of the search term.
+        """
+        search = request.query_params.get('search', '')
+        digest = hashlib.md5(search.encode('utf-8')).hexdigest()
+        return f"users:count:{request.user.pk}:{digest}"
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> Optional[List[Any]]:
+        """Paginate ``queryset`` using the cached row count.
+
+        Args:
+            queryset: Filtered queryset to paginate.
+            request: The list request.
+            view: The calling view.
+
+        Returns:
+            The requested page's objects, or None if pagination is disabled.
+        """
+        if self.get_page_size(request) is None:
+            return None
+
+        key = self.get_count_cache_key(request)
+        page_number = request.query_params.get(self.page_query_param, '1')
+        if page_number in ('1', *self.last_page_strings):
+            count = None
+        else:
+            count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, self.count_cache_timeout)
+
+        self.django_paginator_class = partial(KnownCountPaginator, count=count)
+        return super().paginate_queryset(queryset, request, view)
@@ -4,14 +4,113 @@ This module provides serializers for the User model, supporting role-based user
 creation, profile management, and password changes through Django REST Framework.
 """
 
-from typing import Any, Dict
+import copy
+from collections.abc import Mapping
+from typing import Any, Dict, List
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.settings import api_settings
+from rest_framework_simplejwt.serializers import PasswordField, TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
-from ..models import User
+from django.db import IntegrityError, models, transaction
+from django.utils.crypto import constant_time_compare
+from ..models import Role, User
 
 
-class SerializerClients(serializers.ModelSerializer):
+class CachedListSerializer(serializers.ListSerializer):
+    """List serializer that renders each distinct instance only once.
+
+    The child serializer (and therefore its ``fields``) is built once per
+    list, and rows sharing a primary key reuse the first representation
+    instead of being serialized again. Output is identical to the default
+    ListSerializer.
+
+    Example:
+        >>> class Meta:
+        ...     list_serializer_class = CachedListSerializer
+    """
+
+    def to_representation(self, data) -> List[Dict[str, Any]]:
+        """Serialize ``data``, memoizing rows by primary key.
+
+        Args:
+            data: Queryset, manager or iterable of model instances.
+
+        Returns:
+            List of serialized representations in input order.
+        """
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        cache: Dict[Any, Dict[str, Any]] = {}
+        result = []
+        for item in iterable:
+            key = getattr(item, 'pk', None)
+            if key is None:
+                result.append(self.child.to_representation(item))
+                continue
+            if key not in cache:
+                cache[key] = self.child.to_representation(item)
+            result.append(cache[key])
+        return result
+
+
+class FastModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that introspects its model fields once per class.
+
+    ModelSerializer.get_fields() walks the model's fields, builds every
+    serializer field and copies the declared ones each time a serializer is
+    instantiated. Here the result is built once per concrete class and each
+    instance receives a deep copy, so the field set is identical while the
+    model introspection is skipped.
+
+    Note:
+        Only suitable for serializers whose fields do not depend on the
+        instance, request or context.
+    """
+
+    def get_fields(self) -> Dict[str, serializers.Field]:
+        """Return a fresh copy of the class's cached field prototypes."""
+        cls = type(self)
+        prototypes = cls.__dict__.get('_field_prototypes')
+        if prototypes is None:
+            prototypes = super().get_fields()
+            cls._field_prototypes = prototypes
+        return copy.deepcopy(prototypes)
+
+
+def create_user_with_password(validated_data: Dict[str, Any]) -> User:
+    """Create a user from registration data, hashing the password.
+
+    Email uniqueness is enforced by the database's unique index instead of a
+    serializer-level ``UniqueValidator`` query; a collision surfaces as an
+    ``IntegrityError`` and is translated to a regular 400 validation error.
+
+    Args:
+        validated_data: Validated field data including the raw password.
+
+    Returns:
+        User: The saved user instance.
+
+    Raises:
+        ValidationError: If the email is already registered.
+    """
+    password = validated_data.pop('password')
+    validated_data['email'] = User.objects.normalize_email(validated_data['email'])
+    user = User(**validated_data)
+    user.set_password(password)
+    try:
+        # Savepoint so a collision doesn't poison an enclosing transaction
+        with transaction.atomic():
+            user.save()
+    except IntegrityError:
+        raise serializers.ValidationError(
+            {'email': 'Ya existe una cuenta con este correo electrónico.'}
+        )
+    return user
+
+
+class SerializerClients(FastModelSerializer):
     """Serializer for creating client user accounts.
 
     Handles user registration for client role accounts. Automatically sets
@@ -38,29 +137,42 @@ class SerializerClients(serializers.ModelSerializer):
         'client'
 
     Note:
-        - Password field should be write-only in production (consider adding write_only=True)
+        - Password is write-only and never returned in responses
         - User role defaults to 'client' as defined in User model
-        - Password is stored as plain text without hashing (security issue - needs fixing)
-        - Consider using create() method to hash password with user.set_password()
+        - Duplicate emails are rejected by the DB unique index, not a query
     """
 
+    email = serializers.EmailField(max_length=254, validators=[])
+
     class Meta:
         """Meta options for SerializerClients."""
 
         model = User
         fields = ['username', 'email', 'name', 'password']
+        extra_kwargs = {'password': {'write_only': True}}
 
+    def create(self, validated_data: Dict[str, Any]) -> User:
+        """Create the user with a hashed password.
 
-class SerializerEmploye(serializers.ModelSerializer):
+        Args:
+            validated_data: Validated field data including the raw password.
+
+        Returns:
+            User: The saved user instance.
+        """
+        return create_user_with_password(validated_data)
+
+
+class SerializerEmploye(FastModelSerializer):
     """Serializer for creating employee user accounts.
 
-    Handles user registration for employee role accounts. Automatically sets
-    the user role to 'employe' during validation. Used for staff member
+    Handles user registration for employee role accounts. The user role is
+    always 'employe', supplied by a hidden field. Used for staff member
     registration by administrators.
 
     Meta:
         model: User model this serializer is based on.
-        fields: Includes username, name, email, and password fields only.
+        fields: Includes username, name, email, password and the hidden role.
 
     Example:
         >>> # Create a new employee account
@@ -77,47 +189,35 @@ class SerializerEmploye(serializers.ModelSerializer):
         'employe'
 
     Note:
-        - Role is automatically set to 'employe' in validate() method
-        - Password field should be write-only in production
-        - Password is stored as plain text without hashing (security issue - needs fixing)
-        - Consider using create() method to hash password with user.set_password()
+        - Role is a HiddenField defaulting to 'employe'; clients cannot set it
+        - Password is write-only and never returned in responses
+        - Duplicate emails are rejected by the DB unique index, not a query
     """
 
+    email = serializers.EmailField(max_length=254, validators=[])
+    role = serializers.HiddenField(default=Role.EMPLOYE.value)
+
     class Meta:
         """Meta options for SerializerEmploye."""
 
         model = User
-        fields = ['username', 'name', 'email', 'password']
-
-    def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate and set employee role for the user.
+        fields = ['username', 'name', 'email', 'password', 'role']
+        extra_kwargs = {'password': {'write_only': True}}
 
-        Automatically assigns 'employe' role to the user data during validation,
-        ensuring all users created with this serializer have employee permissions.
+    def create(self, validated_data: Dict[str, Any]) -> User:
+        """Create the employee with a hashed password.
 
         Args:
-            data: Dictionary containing validated field data (username, name,
-                email, password).
+            validated_data: Validated field data including the raw password
+                and the 'employe' role from the hidden field.
 
         Returns:
-            Dict with original data plus 'role' field set to 'employe'.
-
-        Example:
-            >>> data = {
-            ...     'username': 'newstaff',
-            ...     'name': 'New Staff',
-            ...     'email': 'newstaff@example.com',
-            ...     'password': 'pass123'
-            ... }
-            >>> validated_data = serializer.validate(data)
-            >>> validated_data['role']
-            'employe'
+            User: The saved user instance.
         """
-        data['role'] = 'employe'
-        return data
+        return create_user_with_password(validated_data)
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(FastModelSerializer):
     """Serializer for retrieving and updating user profile information.
 
     Handles GET and PATCH requests for user data, returning or updating
@@ -166,6 +266,8 @@ class UserListSerializer(serializers.ModelSerializer):
         - Suitable for both retrieval and partial updates
         - Image field returns URL path to user avatar
         - Role field is included but should be read-only for non-admin users
+        - many=True uses CachedListSerializer (fields built once per list,
+          repeated instances serialized once)
     """
 
     class Meta:
@@ -173,6 +275,39 @@ class UserListSerializer(serializers.ModelSerializer):
 
         model = User
         fields = ['id', 'username', 'name', 'email', 'role', 'image', 'address', 'location', 'province', 'phone', 'is_active', 'can_create', 'can_update', 'can_delete']
+        list_serializer_class = CachedListSerializer
+
+
+class UserUpdateSerializer(UserListSerializer):
+    """Staff-side user update serializer with an optional new password.
+
+    Same fields as UserListSerializer plus a write-only ``password``. A
+    non-empty password is hashed onto the instance before the single save
+    performed by ModelSerializer.update(). Kept separate from
+    UserListSerializer so the /me endpoint cannot change passwords.
+    """
+
+    password = serializers.CharField(write_only=True, required=False, allow_blank=True)
+
+    class Meta(UserListSerializer.Meta):
+        """Meta options for UserUpdateSerializer."""
+
+        fields = UserListSerializer.Meta.fields + ['password']
+
+    def update(self, instance: User, validated_data: Dict[str, Any]) -> User:
+        """Update the user, hashing ``password`` when one is provided.
+
+        Args:
+            instance: User being updated.
+            validated_data: Validated field data, possibly with a raw password.
+
+        Returns:
+            User: The saved user instance.
+        """
+        password = validated_data.pop('password', None)
+        if password:
+            instance.set_password(password)
+        return super().update(instance, validated_data)
 
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -224,6 +359,51 @@ class ChangePasswordSerializer(serializers.Serializer):
     new_password = serializers.CharField(required=True)
     new_password_confirm = serializers.CharField(required=True)
 
+    # Fields above are kept for the schema/browsable API; validation below
+    # reads initial_data directly instead of binding and running each field.
+    _FIELD_NAMES = ('old_password', 'new_password', 'new_password_confirm')
+
+    def to_internal_value(self, data: Any) -> Dict[str, str]:
+        """Check the three required strings without walking ``self.fields``.
+
+        Mirrors CharField(required=True): values must be str/int/float, are
+        whitespace-trimmed and may not be blank. Error messages are DRF's.
+
+        Args:
+            data: Raw request data.
+
+        Returns:
+            Dict with the three trimmed password strings.
+
+        Raises:
+            ValidationError: Per-field errors, keyed like the DRF default.
+        """
+        if not isinstance(data, Mapping):
+            message = self.error_messages['invalid'].format(datatype=type(data).__name__)
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]}, code='invalid'
+            )
+
+        messages = serializers.CharField.default_error_messages
+        validated: Dict[str, str] = {}
+        errors: Dict[str, List[ErrorDetail]] = {}
+        for name in self._FIELD_NAMES:
+            if name not in data:
+                errors[name] = [ErrorDetail(messages['required'], code='required')]
+                continue
+            value = data[name]
+            if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+                errors[name] = [ErrorDetail(messages['invalid'], code='invalid')]
+                continue
+            value = str(value).strip()
+            if not value:
+                errors[name] = [ErrorDetail(messages['blank'], code='blank')]
+                continue
+            validated[name] = value
+        if errors:
+            raise serializers.ValidationError(errors)
+        return validated
+
     def validate(self, data: Dict[str, str]) -> Dict[str, str]:
         """Validate that new password and confirmation match.
 
@@ -253,7 +433,9 @@ class ChangePasswordSerializer(serializers.Serializer):
             >>> serializer.validate(data)
             ValidationError: Las contraseñas no coinciden.
         """
-        if data['new_password'] != data['new_password_confirm']:
+        new = data['new_password']
+        confirm = data['new_password_confirm']
+        if not constant_time_compare(new, confirm):
             raise serializers.ValidationError("Las contraseñas no coinciden.")
         return data
 
@@ -288,12 +470,38 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
 
     username_field = User.EMAIL_FIELD
 
+    email = serializers.EmailField(required=True, write_only=True)
+    password = PasswordField()
+
     def __init__(self, *args, **kwargs):
-        """Initialize the serializer and replace username field with email."""
-        super().__init__(*args, **kwargs)
-        # Remove the username field and add email field
-        self.fields['email'] = serializers.EmailField(required=True)
-        self.fields.pop('username', None)
+        """Initialize the serializer with the class-level email/password fields.
+
+        TokenObtainSerializer.__init__ only (re)builds the username and
+        password fields on every instance; both are declared on the class
+        here, so it is skipped.
+        """
+        serializers.Serializer.__init__(self, *args, **kwargs)
+
+    @classmethod
+    def get_token(cls, user: User) -> RefreshToken:
+        """Build the refresh token with only the claims the API relies on.
+
+        Embeds the user id and role directly instead of going through
+        RefreshToken.for_user(). The signing backend itself is the module-level
+        one cached by SimpleJWT, so no settings or key material is reloaded
+        per login.
+
+        Args:
+            user: The authenticated user.
+
+        Returns:
+            RefreshToken: Token carrying ``user_id`` and ``role`` claims; the
+            access token is derived from it by the parent validate().
+        """
+        token = RefreshToken()
+        token[jwt_settings.USER_ID_CLAIM] = user.pk
+        token['role'] = user.role
+        return token
 
 
 class PasswordResetRequestSerializer(serializers.Serializer):
@@ -303,7 +511,8 @@ class PasswordResetRequestSerializer(serializers.Serializer):
     email address. A password reset token will be generated and sent to this email.
 
     Attributes:
-        email (EmailField): User's registered email address.
+        email (EmailField): Email address to send the reset link to. Whether
+            an account exists is resolved by the view, in its single lookup.
 
     Example:
         >>> data = {'email': 'user@example.com'}
@@ -315,22 +524,6 @@ class PasswordResetRequestSerializer(serializers.Serializer):
 
     email = serializers.EmailField(required=True)
 
-    def validate_email(self, value: str) -> str:
-        """Validate that the email exists in the database.
-
-        Args:
-            value: Email address provided by user.
-
-        Returns:
-            Validated email address.
-
-        Raises:
-            ValidationError: If email is not registered.
-        """
-        if not User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("No existe una cuenta con este correo electrónico.")
-        return value
-
 
 class PasswordResetConfirmSerializer(serializers.Serializer):
     """Serializer for password reset confirmation (step 2).
@@ -358,9 +551,36 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
     new_password = serializers.CharField(required=True, write_only=True, min_length=6)
     new_password_confirm = serializers.CharField(required=True, write_only=True)
 
+    def to_internal_value(self, data: Any) -> Dict[str, str]:
+        """Reject mismatched confirmations before running the field validators.
+
+        When both passwords are strings that differ (after the whitespace
+        trimming CharField would apply), fail immediately; anything else falls
+        through to regular field validation.
+
+        Args:
+            data: Raw request data.
+
+        Returns:
+            Validated data dictionary.
+
+        Raises:
+            ValidationError: If passwords don't match or a field is invalid.
+        """
+        if isinstance(data, Mapping):
+            new = data.get('new_password')
+            confirm = data.get('new_password_confirm')
+            if (isinstance(new, str) and isinstance(confirm, str)
+                    and not constant_time_compare(new.strip(), confirm.strip())):
+                raise serializers.ValidationError({"new_password_confirm": "Las contraseñas no coinciden."})
+        return super().to_internal_value(data)
+
     def validate(self, data: Dict[str, str]) -> Dict[str, str]:
         """Validate that new password and confirmation match.
 
+        Kept as the final check for inputs the fast path above lets through
+        (e.g. non-string values coerced by CharField).
+
         Args:
             data: Dictionary containing token, new_password, and new_password_confirm.
 
@@ -370,6 +590,8 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         Raises:
             ValidationError: If passwords don't match.
         """
-        if data['new_password'] != data['new_password_confirm']:
+        new = data['new_password']
+        confirm = data['new_password_confirm']
+        if not constant_time_compare(new, confirm):
             raise serializers.ValidationError({"new_password_confirm": "Las contraseñas no coinciden."})
         return data
\ No newline at end of file
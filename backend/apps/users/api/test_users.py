@@ -2,9 +2,20 @@ import pytest
 from django.urls import reverse
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 Users = get_user_model()
 
+# Resolved once at import; pytest-django has configured Django by then
+TOKEN_URL = reverse('token_obtain_pair')
+ME_URL = reverse('me')
+CHANGE_PW_URL = reverse('change-password')
+CLIENTS_URL = reverse('clients-list')
+EMPLOYE_URL = reverse('employe-list')
+USERS_URL = reverse('users-list-list')
+
 
 @pytest.fixture
 def api_client():
@@ -13,14 +24,14 @@ def api_client():
 @pytest.fixture
 def create_user(db):
     def _create_user(username, email, name, password, role='client', is_staff=False):
-        user = Users.objects.create_user(
+        user = Users(
             username=username,
             email=email,
             name=name,
-            password=password
+            role=role,
+            is_staff=is_staff,
+            password=make_password(password),
         )
-        user.role = role
-        user.is_staff = is_staff
         user.save()
         return user
     return _create_user
@@ -28,8 +39,7 @@ def create_user(db):
 @pytest.fixture
 def get_token(api_client):
     def _get_token(username, password):
-        url = reverse('token_obtain_pair')
-        response = api_client.post(url, {"username": username, "password": password})
+        response = api_client.post(TOKEN_URL, {"username": username, "password": password})
         return response.data['access']
     return _get_token
 
@@ -38,18 +48,47 @@ def get_token(api_client):
 
 @pytest.mark.django_db
 def test_create_client(api_client):
-    url = reverse('clients-list')
     data = {
         "username": "client1",
         "email": "client@example.com",
         "name": "Client One",
         "password": "securepass123"
     }
-    response = api_client.post(url, data)
+    response = api_client.post(CLIENTS_URL, data)
     assert response.status_code == 201
     assert Users.objects.filter(username="client1").exists()
 
 
+@pytest.mark.django_db
+def test_create_client_hashes_password(api_client):
+    data = {
+        "username": "client4",
+        "email": "client4@example.com",
+        "name": "Client Four",
+        "password": "securepass123"
+    }
+    response = api_client.post(CLIENTS_URL, data)
+    assert response.status_code == 201
+    assert "password" not in response.data
+    user = Users.objects.get(username="client4")
+    assert user.password != "securepass123"
+    assert user.check_password("securepass123")
+
+
+
+@pytest.mark.django_db
+def test_create_client_duplicate_email(api_client, create_user):
+    create_user("client5", "client5@example.com", "Client Five", "securepass123")
+    data = {
+        "username": "client6",
+        "email": "client5@example.com",
+        "name": "Client Six",
+        "password": "securepass123"
+    }
+    response = api_client.post(CLIENTS_URL, data)
+    assert response.status_code == 400
+    assert "email" in response.data
+
 # ------------------ TEST REGISTER EMPLOYEE (REQUIRES STAFF) ------------------
 
 @pytest.mark.django_db
@@ -58,14 +97,13 @@ def test_create_employe_requires_staff(api_client, create_user, get_token):
     token = get_token("admin", "adminpass")
     api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
 
-    url = reverse('employe-list')
     data = {
         "username": "employe1",
         "email": "employe@example.com",
         "name": "Employe One",
         "password": "securepass123"
     }
-    response = api_client.post(url, data)
+    response = api_client.post(EMPLOYE_URL, data)
     assert response.status_code == 201
     assert Users.objects.filter(username="employe1", role="employe").exists()
 
@@ -78,12 +116,29 @@ def test_me_endpoint(api_client, create_user, get_token):
     token = get_token("client2", "clientpass")
     api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
 
-    url = reverse('me')
-    response = api_client.get(url)
+    response = api_client.get(ME_URL)
     assert response.status_code == 200
     assert response.data['username'] == "client2"
 
 
+
+@pytest.mark.django_db
+def test_me_endpoint_not_modified(api_client, create_user, get_token):
+    create_user("client7", "c7@example.com", "Client 7", "clientpass")
+    token = get_token("client7", "clientpass")
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    response = api_client.get(ME_URL)
+    assert response.status_code == 200
+    etag = response["ETag"]
+
+    response = api_client.get(ME_URL, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    api_client.patch(ME_URL, {"phone": "600000000"})
+    response = api_client.get(ME_URL, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["phone"] == "600000000"
+
 # ------------------ TEST CHANGE PASSWORD ------------------
 
 @pytest.mark.django_db
@@ -92,19 +147,41 @@ def test_change_password(api_client, create_user, get_token):
     token = get_token("client3", "oldpass")
     api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
 
-    url = reverse('change-password')
     data = {
         "old_password": "oldpass",
         "new_password": "newsecure123",
         "new_password_confirm": "newsecure123"
     }
-    response = api_client.post(url, data)
+    response = api_client.post(CHANGE_PW_URL, data)
     assert response.status_code == 200
 
     # Confirm that new password works
-    new_token = api_client.post(reverse('token_obtain_pair'), {
+    new_token = api_client.post(TOKEN_URL, {
         "username": "client3",
         "password": "newsecure123"
     })
     assert new_token.status_code == 200
     assert "access" in new_token.data
+
+
+# ------------------ TEST USERS LIST QUERY COUNT ------------------
+
+@pytest.mark.django_db
+def test_users_list_query_count_is_constant(api_client, create_user, get_token):
+    create_user("boss1", "boss1@example.com", "Boss", "bosspass", role='boss', is_staff=True)
+    token = get_token("boss1", "bosspass")
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def list_queries():
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(USERS_URL)
+        assert response.status_code == 200
+        return len(ctx.captured_queries)
+
+    create_user("listed1", "listed1@example.com", "Listed 1", "pass")
+    baseline = list_queries()
+    for i in range(2, 7):
+        create_user(f"listed{i}", f"listed{i}@example.com", f"Listed {i}", "pass")
+    # Serializing more rows must not add (lazy-load) queries
+    assert list_queries() == baseline
+
@@ -31,7 +31,10 @@ Typical usage example:
     POST /api/change-password/ - Change user password
 """
 
-from typing import Any
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
 
 from rest_framework.permissions import AllowAny, IsAuthenticated, BasePermission
 from rest_framework.response import Response
@@ -39,20 +42,98 @@ from rest_framework import status, viewsets
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.filters import SearchFilter
+from django.db import IntegrityError, transaction
 from django.db.models import Q, QuerySet
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
-from apps.users.permisionsUsers import IsStaff, IsBoss, IsStaffOrEmploye
-from apps.users.models import User, PasswordResetToken
+from apps.users.permissions import IsStaff, IsBoss, IsStaffOrEmploye, role_bucket
+from apps.users.api.mixins import AutoPrefetchViewSetMixin
+from apps.users.api.pagination import CachedCountPagination
+from apps.users.models import Role, User, PasswordResetToken
 from apps.users.api.serializers import (
     SerializerClients,
     SerializerEmploye,
     UserListSerializer,
+    UserUpdateSerializer,
     ChangePasswordSerializer,
     PasswordResetRequestSerializer,
     PasswordResetConfirmSerializer
 )
-from apps.users.email_service import send_password_reset_email
+from apps.users.tasks import enqueue_password_reset_email
+
+logger = logging.getLogger(__name__)
+
+PASSWORD_RESET_SENT = (
+    "Si existe una cuenta con este correo electrónico, recibirás las "
+    "instrucciones para restablecer tu contraseña."
+)
+
+
+def profile_etag(request, *args, **kwargs) -> str:
+    """Weak ETag for the authenticated user's profile.
+
+    Versioned by ``updated_at`` (auto_now), so any save of the user changes it.
+
+    Args:
+        request: Request with an authenticated user.
+
+    Returns:
+        str: Weak entity tag such as ``W/"42-1760529600000000"``.
+    """
+    user = request.user
+    return f'W/"{user.pk}-{int(user.updated_at.timestamp() * 1_000_000)}"'
+
+
+# Profile dicts by (pk, updated_at), least recently used first. Only the
+# version key is stored, so cached entries never keep User instances alive.
+_PROFILE_CACHE_SIZE = 1024
+_profile_cache: 'OrderedDict[Tuple[int, Any], Dict[str, Any]]' = OrderedDict()
+_profile_cache_lock = threading.Lock()
+
+
+def _profile_payload(user: User) -> Dict[str, Any]:
+    """Return the user's profile dict, built once per (pk, updated_at).
+
+    Any save of the user bumps ``updated_at`` and so misses the cache.
+    Callers must not mutate the returned dict.
+    """
+    key = (user.pk, user.updated_at)
+    with _profile_cache_lock:
+        payload = _profile_cache.get(key)
+        if payload is not None:
+            _profile_cache.move_to_end(key)
+            return payload
+    payload = _build_profile_payload(user)
+    with _profile_cache_lock:
+        _profile_cache[key] = payload
+        if len(_profile_cache) > _PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+    return payload
+
+
+def _build_profile_payload(user: User) -> Dict[str, Any]:
+    """Hand-rolled equivalent of ``UserListSerializer(user).data``.
+
+    Same keys and values, without DRF field binding on this read-only path.
+    """
+    return {
+        'id': user.id,
+        'username': user.username,
+        'name': user.name,
+        'email': user.email,
+        'role': user.role,
+        'image': user.image.url if user.image else None,
+        'address': user.address,
+        'location': user.location,
+        'province': user.province,
+        'phone': user.phone,
+        'is_active': user.is_active,
+        'can_create': user.can_create,
+        'can_update': user.can_update,
+        'can_delete': user.can_delete,
+    }
 
 
 @extend_schema_view(
@@ -108,7 +189,7 @@ from apps.users.email_service import send_password_reset_email
     ),
 )
 class RegisterEmploye(viewsets.ModelViewSet):
-    queryset = User.objects.filter(role="employe")
+    queryset = User.objects.filter(role=Role.EMPLOYE)
     serializer_class = SerializerEmploye
     permission_classes = [IsStaff]
 
@@ -140,18 +221,14 @@ class RegisterEmploye(viewsets.ModelViewSet):
             Response with created employee data (201) or validation errors (400).
 
         Notes:
-            Password must be provided in plain text and will be hashed using
-            Django's set_password method before saving.
+            Password must be provided in plain text; SerializerEmploye.create
+            hashes it and the user is inserted, already active, in one query.
         """
         serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
-            password = request.data.get("password")
-            user = serializer.save()
-            user.set_password(password)
-            user.is_active = True  # Activate user on registration
-            user.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        serializer.is_valid(raise_exception=True)
+        # Single INSERT: serializer hashes the password, user is active on registration
+        serializer.save(is_active=True)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
 @extend_schema_view(
@@ -226,20 +303,15 @@ class RegisterClients(viewsets.ModelViewSet):
             Response with created client data (201) or validation errors (400).
 
         Notes:
-            Password must be provided in plain text and will be hashed using
-            Django's set_password method before saving. The password field
-            should not be returned in the response.
+            Password must be provided in plain text; SerializerClients.create
+            hashes it and the user is inserted, already active, in one query. The password
+            field is write-only and not returned in the response.
         """
         serializer = self.get_serializer(data=request.data)
-
-        if serializer.is_valid():
-            password = request.data.get("password")
-            user = serializer.save()
-            user.set_password(password)
-            user.is_active = True  # Activate user on registration
-            user.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        serializer.is_valid(raise_exception=True)
+        # Single INSERT: serializer hashes the password, user is active on registration
+        serializer.save(is_active=True)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
 @extend_schema_view(
@@ -288,10 +360,11 @@ class RegisterClients(viewsets.ModelViewSet):
         },
     ),
 )
-class UsersListViewSet(viewsets.ModelViewSet):
+class UsersListViewSet(AutoPrefetchViewSetMixin, viewsets.ModelViewSet):
     serializer_class = UserListSerializer
     filter_backends = [SearchFilter]
     search_fields = ['username', 'email', 'name']
+    pagination_class = CachedCountPagination
 
     def get_permissions(self) -> list[BasePermission]:
         """Return appropriate permissions based on the action.
@@ -304,6 +377,12 @@ class UsersListViewSet(viewsets.ModelViewSet):
             return [IsStaff()]
         return [IsStaffOrEmploye()]
 
+    def get_serializer_class(self) -> type[UserListSerializer]:
+        """Use UserUpdateSerializer (accepts a password) for updates."""
+        if self.action in ('update', 'partial_update'):
+            return UserUpdateSerializer
+        return super().get_serializer_class()
+
     def get_queryset(self) -> QuerySet[User]:
         """Return filtered queryset based on the requesting user's role.
 
@@ -312,32 +391,23 @@ class UsersListViewSet(viewsets.ModelViewSet):
             - Staff: All users
             - Employees: Clients + self
             - Others: Empty queryset
+            Ordered by id so pages are stable. Relations rendered by the
+            serializer are eager-loaded, and list/retrieve select only the
+            serializer's columns.
         """
         user = self.request.user
-        if user.is_staff:
-            return User.objects.all()
-        elif user.role == "employe":
-            return User.objects.filter(Q(role="client") | Q(id=user.id))
-        return User.objects.none()
-
-    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """List users with additional authorization check.
-
-        Args:
-            request: The HTTP request.
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
-
-        Returns:
-            Response with user list or 403 Forbidden if not authorized.
-
-        Notes:
-            Provides an additional security layer beyond permission classes
-            to ensure only staff and employees can list users.
-        """
-        if not (request.user.is_staff or request.user.role == "employe"):
-            return Response({"detail": "Not authorized."}, status=403)
-        return super().list(request, *args, **kwargs)
+        # Set by IsStaffOrEmploye on reads; writes are guarded by IsStaff
+        bucket = getattr(self.request, '_role_bucket', None) or role_bucket(user)
+        if bucket == "staff":
+            queryset = User.objects.order_by('id')
+        elif bucket == Role.EMPLOYE:
+            queryset = User.objects.filter(Q(role=Role.CLIENT) | Q(id=user.id)).order_by('id')
+        else:
+            return User.objects.none()
+        if self.action in ('list', 'retrieve'):
+            # Read path: load only the columns the serializer renders
+            queryset = queryset.only(*UserListSerializer.Meta.fields)
+        return self.prefetch_for_serializer(queryset)
 
     def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Update a user with password hashing if password is provided.
@@ -357,18 +427,10 @@ class UsersListViewSet(viewsets.ModelViewSet):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
-
-        if serializer.is_valid():
-            password = request.data.get("password")
-            user = serializer.save()
-
-            # Hash password if provided
-            if password:
-                user.set_password(password)
-                user.save()
-
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        serializer.is_valid(raise_exception=True)
+        # UserUpdateSerializer hashes a validated password before its save
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
     def partial_update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Partially update a user with password hashing if password is provided.
@@ -409,6 +471,7 @@ class UsersListViewSet(viewsets.ModelViewSet):
 class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(etag(profile_etag))
     def get(self, request: Request) -> Response:
         """Retrieve the authenticated user's profile information.
 
@@ -416,11 +479,15 @@ class MeView(APIView):
             request: The HTTP request containing authenticated user.
 
         Returns:
-            Response with the user's profile data.
+            Response with the user's profile data, or 304 when the client's
+            If-None-Match still matches the profile's ETag.
+
+        Notes:
+            The profile is built without a serializer and memoized per
+            (pk, updated_at); PATCH still validates through UserListSerializer.
         """
         user = request.user
-        serializer = UserListSerializer(user)
-        return Response(serializer.data)
+        return Response(_profile_payload(user))
 
     def patch(self, request: Request) -> Response:
         """Update the authenticated user's profile information.
@@ -479,7 +546,7 @@ class ChangePasswordView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             user.set_password(serializer.validated_data['new_password'])
-            user.save()
+            user.save(update_fields=['password'])
             return Response(
                 {"detail": "Password updated successfully."},
                 status=status.HTTP_200_OK
@@ -528,41 +595,45 @@ class PasswordResetRequestView(APIView):
         Note:
             - Token is valid for 1 hour
             - Previous unused tokens are invalidated
-            - Email must be registered in the system
+            - Unknown emails get the same 200 response (no account enumeration)
+            - The email is sent in the background once the token is committed
         """
         serializer = PasswordResetRequestSerializer(data=request.data)
         if serializer.is_valid():
             email = serializer.validated_data['email']
-            user = User.objects.get(email=email)
+            user = (
+                User.objects.only('id', 'email', 'name', 'username')
+                .filter(email__iexact=email).order_by('pk').first()
+            )
+            if user is None:
+                # Same response as a known email: don't reveal unknown ones
+                return Response({"detail": PASSWORD_RESET_SENT}, status=status.HTTP_200_OK)
 
-            # Invalidate previous unused tokens for this user
-            PasswordResetToken.objects.filter(user=user, used=False).update(used=True)
+            try:
+                with transaction.atomic():
+                    # Invalidate previous unused tokens for this user
+                    PasswordResetToken.objects.filter(user_id=user.id, used=False).update(used=True)
 
-            # Create new reset token
-            reset_token = PasswordResetToken.objects.create(user=user)
+                    # Create new reset token
+                    reset_token = PasswordResetToken.objects.create(user=user)
+            except IntegrityError:
+                # A concurrent request just issued this user's active token
+                return Response({"detail": PASSWORD_RESET_SENT}, status=status.HTTP_200_OK)
 
             # Get language from request (default to Spanish)
             language = request.data.get('language', 'es')
 
-            # Send email with reset link
+            # Send email with reset link off the request thread
             try:
-                email_sent = send_password_reset_email(user, reset_token, language)
-                if not email_sent:
-                    return Response({
-                        "detail": "Error al enviar el correo electrónico. Por favor, intenta nuevamente."
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                enqueue_password_reset_email(user.id, reset_token.id, language)
             except Exception as e:
                 # Log error but don't expose details to user
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.error(f"Error sending password reset email: {e}")
                 return Response({
                     "detail": "Error al enviar el correo electrónico. Por favor, intenta nuevamente."
                 }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            return Response({
-                "detail": "Se ha enviado un correo electrónico con las instrucciones para restablecer tu contraseña."
-            }, status=status.HTTP_200_OK)
+            return Response({"detail": PASSWORD_RESET_SENT}, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -607,8 +678,8 @@ class PasswordResetConfirmView(APIView):
             }
 
         Note:
-            - Token must be valid and not expired
-            - Token can only be used once
+            - Token must be valid and not expired (checked in the lookup query)
+            - Token can only be used once; the row is locked for the update
             - New password must meet minimum requirements
         """
         serializer = PasswordResetConfirmSerializer(data=request.data)
@@ -616,30 +687,30 @@ class PasswordResetConfirmView(APIView):
             token_str = serializer.validated_data['token']
             new_password = serializer.validated_data['new_password']
 
-            try:
-                reset_token = PasswordResetToken.objects.get(token=token_str)
+            with transaction.atomic():
+                # Lock the token row; a concurrent confirm holding it is
+                # skipped and treated as an invalid token.
+                reset_token = (
+                    PasswordResetToken.objects
+                    .select_for_update(skip_locked=True, of=('self',))
+                    .get_valid(token_str)
+                )
 
-                if not reset_token.is_valid():
+                if reset_token is None:
                     return Response({
-                        "detail": "El token ha expirado o ya fue utilizado."
+                        "detail": "Token inválido, expirado o ya utilizado."
                     }, status=status.HTTP_400_BAD_REQUEST)
 
                 # Reset password
                 user = reset_token.user
                 user.set_password(new_password)
-                user.save()
-
-                # Mark token as used
-                reset_token.used = True
-                reset_token.save()
+                user.save(update_fields=['password'])
 
-                return Response({
-                    "detail": "Contraseña actualizada exitosamente."
-                }, status=status.HTTP_200_OK)
+                # Mark token as used; plain UPDATE, no model save() round
+                PasswordResetToken.objects.filter(id=reset_token.id).update(used=True)
 
-            except PasswordResetToken.DoesNotExist:
-                return Response({
-                    "detail": "Token inválido."
-                }, status=status.HTTP_400_BAD_REQUEST)
+            return Response({
+                "detail": "Contraseña actualizada exitosamente."
+            }, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
@@ -2,13 +2,39 @@
 Email service for sending password reset emails using Brevo API.
 """
 import logging
+import orjson
 import requests
 from datetime import datetime
-from django.template.loader import render_to_string
+from functools import lru_cache
+from django.template.loader import get_template
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+BREVO_API_URL = "https://api.brevo.com/v3/smtp/email"
+
+# One pooled, keep-alive session for all Brevo calls, so only the first send
+# pays for the TCP + TLS handshake. Retries cover connection errors and
+# gateway errors; urllib3 never re-sends a POST whose request went out.
+_BREVO_SESSION = requests.Session()
+_BREVO_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+_BREVO_SESSION.headers.update({
+    "accept": "application/json",
+    "content-type": "application/json",
+})
+
+
+@lru_cache(maxsize=None)
+def _password_reset_template():
+    """Load and compile the password reset template once per process."""
+    return get_template('emails/password_reset.html')
+
 
 def send_password_reset_email(user, reset_token, language='es'):
     """
@@ -34,8 +60,7 @@ def send_password_reset_email(user, reset_token, language='es'):
             subject = "🔑 Reset Password - Equus Pub"
 
         # Render HTML template
-        html_content = render_to_string(
-            'emails/password_reset.html',
+        html_content = _password_reset_template().render(
             {
                 'language': language,
                 'user_name': user.name or user.username,
@@ -69,14 +94,10 @@ def _send_via_brevo_api(to_email, to_name, subject, html_content):
         logger.error("BREVO_API_KEY not configured in settings")
         return False
 
-    url = "https://api.brevo.com/v3/smtp/email"
-    headers = {
-        "accept": "application/json",
-        "api-key": brevo_api_key,
-        "content-type": "application/json"
-    }
+    headers = {"api-key": brevo_api_key}
 
-    payload = {
+    # Pre-encoded with orjson; the session already sends content-type: application/json
+    body = orjson.dumps({
         "sender": {
             "name": "Equus Pub",
             "email": settings.DEFAULT_FROM_EMAIL
@@ -89,10 +110,10 @@ def _send_via_brevo_api(to_email, to_name, subject, html_content):
         ],
         "subject": subject,
         "htmlContent": html_content
-    }
+    })
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _BREVO_SESSION.post(BREVO_API_URL, data=body, headers=headers, timeout=30)
         response.raise_for_status()
         logger.info(f"Email sent successfully via Brevo API to {to_email}")
         return True
@@ -0,0 +1,28 @@
+"""Password hashers for the users app.
+
+Argon2id parameters are read from settings so operators can raise the
+cost as hardware improves without a code change. Django re-hashes a
+user's password transparently on the next successful login whenever the
+configured parameters differ from the stored ones.
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class ConfigurableArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id hasher whose cost parameters come from settings.
+
+    Settings:
+        ARGON2_TIME_COST: Number of iterations (Django default: 2).
+        ARGON2_MEMORY_COST: Memory in KiB (Django default: 102400).
+        ARGON2_PARALLELISM: Number of lanes (Django default: 8).
+
+    Note:
+        Keeps Django's ``argon2`` algorithm name, so hashes created by the
+        stock Argon2PasswordHasher stay verifiable.
+    """
+
+    time_cost = getattr(settings, 'ARGON2_TIME_COST', Argon2PasswordHasher.time_cost)
+    memory_cost = getattr(settings, 'ARGON2_MEMORY_COST', Argon2PasswordHasher.memory_cost)
+    parallelism = getattr(settings, 'ARGON2_PARALLELISM', Argon2PasswordHasher.parallelism)
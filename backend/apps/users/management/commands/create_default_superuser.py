@@ -12,13 +12,15 @@ class Command(BaseCommand):
         password = os.environ.get('DJANGO_SUPERUSER_PASSWORD', 'admin123')
         name = os.environ.get('DJANGO_SUPERUSER_NAME', 'Administrator')
 
-        if not User.objects.filter(username=username).exists():
-            User.objects.create_superuser(
-                username=username,
-                email=email,
-                password=password,
-                name=name
-            )
-            self.stdout.write(self.style.SUCCESS(f'✅ Superuser "{username}" created successfully'))
-        else:
+        # Checked first so the (slow) password hash only runs on creation
+        if User.objects.filter(username=username).exists():
             self.stdout.write(self.style.WARNING(f'⚠️  Superuser "{username}" already exists'))
+            return
+
+        User.objects.create_superuser(
+            username=username,
+            email=email,
+            password=password,
+            name=name
+        )
+        self.stdout.write(self.style.SUCCESS(f'✅ Superuser "{username}" created successfully'))
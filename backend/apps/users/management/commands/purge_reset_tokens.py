@@ -0,0 +1,19 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from apps.users.models import PasswordResetToken
+
+
+class Command(BaseCommand):
+    help = 'Delete password reset tokens that expired more than --days days ago (run periodically, e.g. from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=1,
+            help='Keep expired tokens for this many days before deleting them (default: 1).',
+        )
+
+    def handle(self, *args, **options):
+        deleted = PasswordResetToken.objects.purge_expired(timedelta(days=options['days']))
+        self.stdout.write(self.style.SUCCESS(f'✅ Deleted {deleted} expired password reset tokens'))
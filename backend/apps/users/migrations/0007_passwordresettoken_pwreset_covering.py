@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='passwordresettoken',
+            index=models.Index(fields=['token', 'expires_at'], name='pwreset_covering'),
+        ),
+    ]
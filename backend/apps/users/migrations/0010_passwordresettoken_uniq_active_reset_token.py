@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+def invalidate_duplicate_active_tokens(apps, schema_editor):
+    """Keep only each user's newest unused token so the constraint can be added."""
+    PasswordResetToken = apps.get_model('users', 'PasswordResetToken')
+    seen = set()
+    stale = []
+    active = PasswordResetToken.objects.filter(used=False).order_by('user_id', '-created_at', '-id')
+    for token_id, user_id in active.values_list('id', 'user_id'):
+        if user_id in seen:
+            stale.append(token_id)
+        else:
+            seen.add(user_id)
+    if stale:
+        PasswordResetToken.objects.filter(id__in=stale).update(used=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0009_role_and_expiry_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(invalidate_duplicate_active_tokens, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='passwordresettoken',
+            constraint=models.UniqueConstraint(condition=models.Q(('used', False)), fields=('user',), name='uniq_active_reset_token'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_passwordresettoken_uniq_active_reset_token'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('client', 'client'), ('boss', 'boss'), ('employe', 'employe'), ('guest', 'guest')], default='client', max_length=20, verbose_name='Role'),
+        ),
+    ]
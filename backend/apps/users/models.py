@@ -5,14 +5,37 @@ AbstractUser to support role-based access control and additional user profile
 information for the digital menu system.
 """
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Iterable, Mapping, Optional
+from django.contrib.auth.hashers import make_password
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.utils import timezone
+import os
 import secrets
 from datetime import timedelta
 
 
+class Role(models.TextChoices):
+    """User roles stored in ``User.role``.
+
+    Members are ``str`` subclasses, so ``user.role == Role.BOSS`` works
+    against values loaded from the database; ``Role.BOSS.value`` is the
+    plain string.
+    """
+
+    CLIENT = 'client', 'client'
+    BOSS = 'boss', 'boss'
+    EMPLOYE = 'employe', 'employe'
+    GUEST = 'guest', 'guest'
+
+
+# Lifetime of a password reset token
+PASSWORD_RESET_TOKEN_TTL = timedelta(hours=1)
+
+
 class UserManager(BaseUserManager):
     """Custom user manager for creating users and superusers.
 
@@ -22,10 +45,11 @@ class UserManager(BaseUserManager):
     Methods:
         create_user: Creates and saves a regular user with the given credentials.
         create_superuser: Creates and saves a superuser with staff privileges.
+        bulk_create_users: Creates many users with batched INSERTs.
 
     Note:
         - Email is required for user creation
-        - Superusers are automatically assigned the 'boss' role
+        - Superusers are automatically assigned the 'boss' role (single INSERT)
         - Passwords are properly hashed using set_password()
     """
 
@@ -34,7 +58,8 @@ class UserManager(BaseUserManager):
         username: str,
         email: str,
         name: str,
-        password: Optional[str] = None
+        password: Optional[str] = None,
+        **extra_fields
     ) -> 'User':
         """Create and save a regular user with the given credentials.
 
@@ -43,6 +68,8 @@ class UserManager(BaseUserManager):
             email: User's email address, will be normalized.
             name: User's full name or display name.
             password: Plain text password to be hashed. Defaults to None.
+            **extra_fields: Additional model fields (e.g. is_staff, role)
+                persisted in the same INSERT.
 
         Returns:
             User: The newly created user instance.
@@ -66,7 +93,8 @@ class UserManager(BaseUserManager):
         if not email:
             raise ValueError("you need to provide an email")
         user = self.model(
-            username=username, email=self.normalize_email(email), name=name
+            username=username, email=self.normalize_email(email), name=name,
+            **extra_fields
         )
         user.set_password(password)
         user.save()
@@ -103,17 +131,61 @@ class UserManager(BaseUserManager):
             >>> superuser.role
             'boss'
         """
-        user = self.create_user(
+        return self.create_user(
             username=username,
             email=email,
             name=name,
             password=password,
+            is_staff=True,
+            role=Role.BOSS,
         )
 
-        user.is_staff = True
-        user.role = 'boss'
-        user.save()
-        return user
+    def bulk_create_users(
+        self,
+        users_data: Iterable[Mapping[str, Any]],
+        hasher: Optional[str] = None,
+        batch_size: int = 500,
+        ignore_conflicts: bool = False,
+    ) -> list['User']:
+        """Create many users at once, hashing passwords in parallel.
+
+        Passwords are hashed concurrently on a thread pool sized to the CPU
+        count (Argon2 releases the GIL) and the rows are written with
+        bulk_create, so N users cost ceil(N / batch_size) INSERTs instead of N.
+
+        Args:
+            users_data: Dicts with ``username``, ``email``, ``name`` and
+                ``password`` (None for an unusable password); any other key
+                is passed to the model as a field value.
+            hasher: Hasher algorithm name (e.g. 'md5' for fixtures). Defaults
+                to the first entry of PASSWORD_HASHERS.
+            batch_size: Rows per INSERT. Defaults to 500.
+            ignore_conflicts: Skip rows that violate a unique constraint
+                instead of failing. Primary keys are not set on the returned
+                instances in that case.
+
+        Returns:
+            list[User]: The created user instances.
+
+        Raises:
+            ValueError: If any entry has no email.
+
+        Note:
+            bulk_create does not call save() or send post_save signals.
+        """
+        users_data = [dict(data) for data in users_data]
+        if any(not data.get('email') for data in users_data):
+            raise ValueError("you need to provide an email")
+        hash_one = partial(make_password, salt=None, hasher=hasher or 'default')
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            hashes = list(executor.map(
+                hash_one, [data.pop('password', None) for data in users_data]
+            ))
+        users = []
+        for data, password_hash in zip(users_data, hashes):
+            data['email'] = self.normalize_email(data['email'])
+            users.append(self.model(password=password_hash, **data))
+        return self.bulk_create(users, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
 
 
 class User(AbstractUser):
@@ -131,12 +203,14 @@ class User(AbstractUser):
         image (ImageField): User avatar uploaded to 'avatar/' directory.
                            Defaults to 'avatar/default.jpg'.
         is_staff (bool): Whether user has staff/admin privileges. Defaults to False.
-        role (str): User's role in the system. Choices: 'client', 'boss', 'employe'.
-                   Defaults to 'client'.
+        role (str): User's role in the system (see Role). Choices: 'client', 'boss',
+                   'employe', 'guest'. Defaults to 'client'.
         address (str): User's street address (max 250 chars, optional).
         location (str): User's city or locality (max 250 chars, optional).
         province (str): User's province or state (max 100 chars, optional).
         phone (str): User's phone number (max 20 chars, optional).
+        updated_at (datetime): Last time the row was saved; versions the
+                              cached /me profile.
 
     Role Choices:
         - client: Regular customer with ordering permissions
@@ -178,28 +252,10 @@ class User(AbstractUser):
         - Email is required for user creation
         - Default avatar is provided at 'avatar/default.jpg'
         - Table name preserved as 'users_users' for backward compatibility
-        - All users have full permissions (has_perm returns True)
+        - All users have full permissions (has_perm returns True); the
+          permission/group tables are never queried
     """
 
-    ROLE = (
-        (
-            "client",
-            "client",
-        ),
-        (
-            "boss",
-            "boss",
-        ),
-        (
-            "employe",
-            "employe",
-        ),
-        (
-            "guest",
-            "guest",
-        ),
-    )
-
     # Custom manager
     objects = UserManager()
 
@@ -212,7 +268,7 @@ class User(AbstractUser):
     )
     # Permissions
     is_staff = models.BooleanField(default=False)
-    role = models.CharField("Role", choices=ROLE, max_length=50, default="client")
+    role = models.CharField("Role", choices=Role.choices, max_length=20, default=Role.CLIENT)
     # Granular permissions for employe role
     can_create = models.BooleanField("Can Create", default=True, help_text="Allow user to create new items")
     can_update = models.BooleanField("Can Update", default=True, help_text="Allow user to update existing items")
@@ -222,9 +278,17 @@ class User(AbstractUser):
     location = models.CharField("Location", max_length=250, blank=True, null=True)
     province = models.CharField("Province", max_length=100, blank=True, null=True)
     phone = models.CharField("Phone", max_length=20, blank=True, null=True)
+    updated_at = models.DateTimeField("Updated At", auto_now=True)
 
     class Meta:
         db_table = 'users_users'  # Keep the old table name to avoid migration issues
+        indexes = [
+            # Case-insensitive email lookups (password reset, login by email)
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+            # Role filters in permission checks and user listings
+            models.Index(fields=['role'], name='user_role_idx'),
+            models.Index(fields=['is_staff', 'role'], name='user_staff_role_idx'),
+        ]
 
     def __str__(self) -> str:
         """Return string representation of the user.
@@ -280,10 +344,106 @@ class User(AbstractUser):
         """
         return True
 
+    def get_user_permissions(self, obj: Optional[object] = None) -> frozenset:
+        """Return no per-user permission rows.
+
+        has_perm() grants everything, so the auth_permission tables are never
+        consulted; skipping the backends avoids their queries.
+
+        Args:
+            obj: Optional object to check permissions against. Ignored.
+
+        Returns:
+            frozenset: Always empty.
+        """
+        return frozenset()
+
+    def get_group_permissions(self, obj: Optional[object] = None) -> frozenset:
+        """Return no group permission rows (see get_user_permissions).
+
+        Args:
+            obj: Optional object to check permissions against. Ignored.
+
+        Returns:
+            frozenset: Always empty.
+        """
+        return frozenset()
+
+    def get_all_permissions(self, obj: Optional[object] = None) -> frozenset:
+        """Return no permission rows (see get_user_permissions).
+
+        Args:
+            obj: Optional object to check permissions against. Ignored.
+
+        Returns:
+            frozenset: Always empty.
+        """
+        return frozenset()
+
     USERNAME_FIELD = "username"
     REQUIRED_FIELDS = ["email", "name"]
 
 
+class PasswordResetTokenQuerySet(models.QuerySet):
+    """QuerySet for password reset tokens with DB-side validity filters."""
+
+    def valid(self) -> 'PasswordResetTokenQuerySet':
+        """Return tokens that are unused and not yet expired.
+
+        Returns:
+            PasswordResetTokenQuerySet: Filtered queryset; the predicate runs
+            in the database instead of calling is_valid() per row.
+        """
+        return self.filter(used=False, expires_at__gt=timezone.now())
+
+    def with_user(self) -> 'PasswordResetTokenQuerySet':
+        """Join the owning user so ``token.user`` needs no extra query.
+
+        Returns:
+            PasswordResetTokenQuerySet: Queryset with ``select_related('user')``.
+        """
+        return self.select_related('user')
+
+    def get_valid(self, token: str) -> Optional['PasswordResetToken']:
+        """Return the valid token matching ``token``, or None.
+
+        Args:
+            token: Token string received from the client.
+
+        Returns:
+            PasswordResetToken (with its user joined) or None if the token is
+            unknown, used or expired.
+
+        Example:
+            >>> reset_token = PasswordResetToken.objects.get_valid('abc123...')
+            >>> if reset_token is None:
+            ...     # Invalid, used or expired
+            ...     pass
+        """
+        return self.valid().with_user().filter(token=token).first()
+
+    def purge_expired(self, grace: timedelta = timedelta(days=1)) -> int:
+        """Delete tokens that expired more than ``grace`` ago.
+
+        Uses ``_raw_delete`` so a single ``DELETE ... WHERE expires_at < ...``
+        is issued (served by pwreset_expires_used_idx) without loading rows,
+        sending signals or walking cascades. Nothing references
+        PasswordResetToken, so skipping the collector is safe.
+
+        Args:
+            grace: How long after expiry a token is kept. Defaults to 1 day.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        expired = self.filter(expires_at__lt=timezone.now() - grace)
+        return expired._raw_delete(using=expired.db)
+
+
+class PasswordResetTokenManager(models.Manager.from_queryset(PasswordResetTokenQuerySet)):
+    """Manager exposing ``valid()``, ``with_user()`` and ``get_valid()``."""
+
+
 class PasswordResetToken(models.Model):
     """Model for managing password reset tokens.
 
@@ -309,16 +469,22 @@ class PasswordResetToken(models.Model):
         >>> # Check if token is still valid
         >>> if reset_token.is_valid():
         ...     user.set_password('newpassword')
-        ...     user.save()
-        ...     reset_token.used = True
-        ...     reset_token.save()
+        ...     user.save(update_fields=['password'])
+        ...     reset_token.mark_used()
 
     Note:
         - Tokens expire 1 hour after creation
         - Tokens can only be used once (used=True after first use)
-        - Old tokens should be cleaned up periodically
+        - A user has at most one unused token (uniq_active_reset_token);
+          mark previous tokens used before creating a new one
+        - Old tokens are removed by the purge_reset_tokens management command
+          (run it periodically, e.g. from cron)
+        - Prefer PasswordResetToken.objects.get_valid(token) for lookups; it
+          checks validity in the same query
     """
 
+    objects = PasswordResetTokenManager()
+
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -335,18 +501,42 @@ class PasswordResetToken(models.Model):
         verbose_name = 'Password Reset Token'
         verbose_name_plural = 'Password Reset Tokens'
         ordering = ['-created_at']
+        indexes = [
+            # Confirm flow reads token + expiry under a row lock
+            models.Index(fields=['token', 'expires_at'], name='pwreset_covering'),
+            # Invalidating a user's outstanding tokens on a new request
+            models.Index(fields=['user', 'used'], name='pwreset_user_used_idx'),
+            # Validity checks and expired-token cleanup
+            models.Index(fields=['expires_at', 'used'], name='pwreset_expires_used_idx'),
+        ]
+        constraints = [
+            # At most one outstanding token per user
+            models.UniqueConstraint(
+                fields=['user'], condition=models.Q(used=False), name='uniq_active_reset_token'
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         """Override save to generate token and set expiration.
 
         Automatically generates a secure random token and sets expiration
         to 1 hour from creation if this is a new instance.
+
+        Note:
+            Updates to an existing token should pass ``update_fields`` (see
+            mark_used()); a bare save() rewrites every column, including the
+            uniquely indexed ``token``.
         """
         if not self.pk:  # New instance
-            self.token = secrets.token_urlsafe(48)  # Generates 64-char token
-            self.expires_at = timezone.now() + timedelta(hours=1)
+            self.token = secrets.token_hex(32)  # 64 hex chars, fills max_length exactly
+            self.expires_at = timezone.now() + PASSWORD_RESET_TOKEN_TTL
         super().save(*args, **kwargs)
 
+    def mark_used(self) -> None:
+        """Mark the token as used, writing only the ``used`` column."""
+        self.used = True
+        self.save(update_fields=['used'])
+
     def is_valid(self) -> bool:
         """Check if the token is still valid.
 
@@ -0,0 +1,111 @@
+"""Role-based DRF permission classes shared by the API apps."""
+
+from rest_framework.permissions import BasePermission,SAFE_METHODS
+from apps.users.models import Role
+
+# Plain str values for the hot comparisons and the _TABLE keys
+BOSS = Role.BOSS.value
+CLIENT = Role.CLIENT.value
+EMPLOYE = Role.EMPLOYE.value
+
+STAFF = 'staff'  # role bucket for is_staff users (see role_bucket)
+
+
+class IsStaff(BasePermission):
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.is_staff)
+
+
+class IsEmploye(BasePermission):
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.role == EMPLOYE)
+
+
+class IsBoss(BasePermission):
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.role == BOSS)
+
+
+def role_bucket(user):
+    """Return 'staff' for staff users, otherwise the user's role."""
+    return STAFF if user.is_staff else user.role
+
+
+def role_perms(request):
+    """Return the requester's permission attributes, resolved once per request.
+
+    Returns:
+        tuple: (is_authenticated, role, can_create, can_update, can_delete),
+        cached on the request so every permission class reads the same tuple.
+    """
+    perms = getattr(request, '_role_perms', None)
+    if perms is None:
+        user = request.user
+        if not user or not user.is_authenticated:
+            perms = (False, None, False, False, False)
+        else:
+            perms = (
+                True,
+                getattr(user, "role", None),
+                getattr(user, "can_create", False),
+                getattr(user, "can_update", False),
+                getattr(user, "can_delete", False),
+            )
+        request._role_perms = perms
+    return perms
+
+
+class IsStaffOrEmploye(BasePermission):
+    def has_permission(self, request, view):
+        user = request.user
+        if not (user and user.is_authenticated):
+            return False
+        # Stashed for views so they don't re-derive it (see role_bucket)
+        request._role_bucket = role_bucket(user)
+        return request._role_bucket in (STAFF, EMPLOYE)
+
+
+def _allow(perms):
+    return True
+
+
+# Methods an endpoint can receive (Django's View.http_method_names, upper-cased)
+_ALL_METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS', 'TRACE')
+
+
+class ProductRolePermission(BasePermission):
+    """Permission class for granular role-based CRUD access control.
+
+    Permissions by role:
+    - boss: Full CRUD access (GET, POST, PUT, PATCH, DELETE)
+    - employe: Granular permissions based on can_create, can_update, can_delete fields
+    - client: Read-only access (GET)
+    - anonymous: Read-only access (GET)
+
+    Safe methods are allowed up front without reading the user. Writes are
+    decided by a (role, method) dispatch table over the role_perms() tuple;
+    any pair not in the table is denied.
+    """
+
+    _TABLE = {
+        # --- boss: CRUD completo ---
+        **{(BOSS, method): _allow for method in _ALL_METHODS},
+        # --- employe: permisos granulares (lectura resuelta antes) ---
+        (EMPLOYE, 'POST'): lambda perms: perms[2],    # can_create
+        (EMPLOYE, 'PUT'): lambda perms: perms[3],     # can_update
+        (EMPLOYE, 'PATCH'): lambda perms: perms[3],   # can_update
+        (EMPLOYE, 'DELETE'): lambda perms: perms[4],  # can_delete
+        (EMPLOYE, 'TRACE'): lambda perms: False,
+    }
+
+    def has_permission(self, request, view):
+        # Every role, and anonymous users, may read: skip the user entirely
+        if request.method in SAFE_METHODS:
+            return True
+        perms = role_perms(request)
+        # Anonymous users have role None and never match the table
+        handler = self._TABLE.get((perms[1], request.method))
+        if handler is not None:
+            return handler(perms)
+        # client, anonymous y cualquier otro rol → solo lectura
+        return False
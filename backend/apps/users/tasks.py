@@ -0,0 +1,63 @@
+"""
+Background jobs for the users app.
+
+There is no task queue in this deployment, so slow I/O that must not hold
+up a response (e.g. the Brevo HTTP call behind password reset emails) runs
+on a small in-process thread pool, dispatched once the surrounding
+transaction has committed so the rows it re-reads are visible.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+
+from .email_service import send_password_reset_email
+from .models import PasswordResetToken
+
+logger = logging.getLogger(__name__)
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='users-tasks')
+
+
+def send_password_reset_email_task(user_id, token_id, language='es'):
+    """
+    Re-fetch the user and token by id and send the password reset email.
+
+    Args:
+        user_id (int): Primary key of the user requesting the reset
+        token_id (int): Primary key of the PasswordResetToken to send
+        language (str): Language code ('es' or 'en')
+
+    Returns:
+        bool: True if email sent successfully
+    """
+    try:
+        reset_token = (
+            PasswordResetToken.objects
+            .select_related('user')
+            .get(pk=token_id, user_id=user_id)
+        )
+        return send_password_reset_email(reset_token.user, reset_token, language)
+    except PasswordResetToken.DoesNotExist:
+        logger.warning(f"Password reset token {token_id} for user {user_id} no longer exists")
+        return False
+    except Exception as e:
+        logger.error(f"Error sending password reset email: {type(e).__name__} - {e}")
+        return False
+    finally:
+        # Pool threads outlive the request cycle; don't leak their connection
+        connection.close()
+
+
+def enqueue_password_reset_email(user_id, token_id, language='es'):
+    """
+    Send the password reset email in the background after commit.
+
+    Args:
+        user_id (int): Primary key of the user requesting the reset
+        token_id (int): Primary key of the PasswordResetToken to send
+        language (str): Language code ('es' or 'en')
+    """
+    transaction.on_commit(
+        lambda: _EXECUTOR.submit(send_password_reset_email_task, user_id, token_id, language)
+    )
@@ -1,8 +1,12 @@
 """Tests for User model and manager."""
 
+from datetime import timedelta
+from io import StringIO
 from django.test import TestCase
 from django.core.exceptions import ValidationError
-from apps.users.models import User
+from django.core.management import call_command
+from django.utils import timezone
+from apps.users.models import PasswordResetToken, User
 
 
 class UserManagerTest(TestCase):
@@ -46,6 +50,19 @@ class UserManagerTest(TestCase):
         self.assertTrue(superuser.is_staff)
         self.assertTrue(superuser.check_password('adminpass123'))
 
+    def test_bulk_create_users(self):
+        """Test bulk creation hashes passwords and persists extra fields."""
+        users = User.objects.bulk_create_users([
+            {'username': f'bulk{i}', 'email': f'bulk{i}@EXAMPLE.com',
+             'name': f'Bulk {i}', 'password': f'pass{i}', 'role': 'employe'}
+            for i in range(3)
+        ], hasher='md5')
+        self.assertEqual(len(users), 3)
+        user = User.objects.get(username='bulk1')
+        self.assertEqual(user.email, 'bulk1@example.com')
+        self.assertEqual(user.role, 'employe')
+        self.assertTrue(user.check_password('pass1'))
+
 
 class UserModelTest(TestCase):
     """Test cases for User model."""
@@ -74,3 +91,26 @@ class UserModelTest(TestCase):
     def test_user_has_module_perms_returns_true(self):
         """Test has_module_perms always returns True."""
         self.assertTrue(self.user.has_module_perms('any_app'))
+
+
+class PurgeResetTokensTest(TestCase):
+    """Test cases for the purge_reset_tokens command."""
+
+    def test_purge_deletes_only_long_expired_tokens(self):
+        """Tokens expired for more than a day are deleted; the rest are kept."""
+        user = User.objects.create_user(
+            username='resetuser',
+            email='reset@example.com',
+            name='Reset User',
+            password='testpass123'
+        )
+        stale = PasswordResetToken.objects.create(user=user)
+        stale.mark_used()
+        PasswordResetToken.objects.filter(pk=stale.pk).update(
+            expires_at=timezone.now() - timedelta(days=2)
+        )
+        fresh = PasswordResetToken.objects.create(user=user)
+
+        call_command('purge_reset_tokens', stdout=StringIO())
+
+        self.assertEqual(list(PasswordResetToken.objects.values_list('pk', flat=True)), [fresh.pk])
@@ -1,16 +1,40 @@
 #!/usr/bin/env python
 """Script para asignar ingredientes a los productos"""
 import os
+import re
 import django
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 django.setup()
 
+from django.db import transaction
+
 from apps.products.models import Product
 from apps.ingredients.models import Ingredient
 
+# Modelo de traducciones de parler, resuelto una sola vez
+IngredientTranslation = Ingredient._parler_meta.root_model
+
+# Ingredientes extra que se asignan si ya existen (no se crean aquí)
+EXTRA_NAMES = ['Jamón serrano', 'Jamón york', 'Huevo', 'Bacon', 'Queso de cabra', 'Queso']
+
+
+def ingredients_by_name(names):
+    """Ingredientes existentes indexados por nombre en español (una consulta)"""
+    return {
+        t.name: t.master
+        for t in IngredientTranslation.objects.filter(
+            name__in=names, language_code='es'
+        ).select_related('master')
+    }
+
+
 def create_base_ingredients():
-    """Crear ingredientes base comunes"""
+    """Crear ingredientes base comunes.
+
+    Devuelve un dict nombre ES -> ingrediente con los base y los extras
+    existentes, cargados todos en una sola consulta.
+    """
     base_ingredients = [
         {'name_es': 'Patatas', 'name_en': 'Potatoes', 'price': 0},
         {'name_es': 'Lechuga', 'name_en': 'Lettuce', 'price': 0},
@@ -30,97 +54,135 @@ def create_base_ingredients():
         {'name_es': 'Tomate cherry', 'name_en': 'Cherry tomato', 'price': 0},
     ]
 
-    ingredients_dict = {}
-    for ing_data in base_ingredients:
-        existing = Ingredient.objects.filter(translations__name=ing_data['name_es']).first()
-
-        if not existing:
-            ing = Ingredient.objects.create(price=ing_data['price'])
-            ing.set_current_language('es')
-            ing.name = ing_data['name_es']
-            ing.save()
-            ing.set_current_language('en')
-            ing.name = ing_data['name_en']
-            ing.save()
-            print(f"✓ Ingrediente base creado: {ing_data['name_es']}")
-            ingredients_dict[ing_data['name_es']] = ing
-        else:
-            ingredients_dict[ing_data['name_es']] = existing
+    # Una sola consulta para todos los ingredientes ya existentes
+    names = [d['name_es'] for d in base_ingredients]
+    ingredients_dict = ingredients_by_name(names + EXTRA_NAMES)
+    missing = [d for d in base_ingredients if d['name_es'] not in ingredients_dict]
+
+    with transaction.atomic():
+        created = Ingredient.objects.bulk_create(
+            [Ingredient(price=d['price']) for d in missing]
+        )
+        # Traducciones ES y EN de todos los ingredientes nuevos en un INSERT
+        IngredientTranslation.objects.bulk_create([
+            IngredientTranslation(master_id=ing.pk, language_code=lang, name=d[f'name_{lang}'])
+            for ing, d in zip(created, missing)
+            for lang in ('es', 'en')
+        ])
+
+    for ing, d in zip(created, missing):
+        print(f"✓ Ingrediente base creado: {d['name_es']}")
+        ingredients_dict[d['name_es']] = ing
 
     return ingredients_dict
 
-def assign_ingredients_to_products(ingredients):
-    """Asignar ingredientes a productos basándose en nombres y descripciones"""
-
-    # Obtener ingredientes extras
-    extras = {
-        'Jamón serrano': Ingredient.objects.filter(translations__name='Jamón serrano').first(),
-        'Jamón york': Ingredient.objects.filter(translations__name='Jamón york').first(),
-        'Huevo': Ingredient.objects.filter(translations__name='Huevo').first(),
-        'Bacon': Ingredient.objects.filter(translations__name='Bacon').first(),
-        'Queso de cabra': Ingredient.objects.filter(translations__name='Queso de cabra').first(),
-        'Queso': Ingredient.objects.filter(translations__name='Queso').first(),
-    }
-
-    # Mapeo simple: buscar palabras clave y asignar ingredientes
-    products = Product.objects.all()
-    count = 0
+# Palabras clave buscadas en nombre/descripción y la etiqueta que activan
+KEYWORDS = [
+    ('patatas', 'patatas'),
+    ('ensalada', 'ensalada'),
+    ('hamburguesa', 'burger'),
+    ('burger', 'burger'),
+    ('campero', 'bocadillo'),
+    ('montadito', 'bocadillo'),
+    ('pepito', 'bocadillo'),
+    ('sandwich', 'bocadillo'),
+    ('serranito', 'bocadillo'),
+    ('pollo', 'pollo'),
+    ('cerdo', 'cerdo'),
+    ('lomo', 'lomo'),
+    ('atún', 'atún'),
+    ('serrano', 'serrano'),
+    ('bacon', 'bacon'),
+    ('huevo', 'huevo'),
+]
+KEYWORD_TAGS = dict(KEYWORDS)
+
+# Una sola pasada por texto para todas las palabras clave. El lookahead
+# admite coincidencias solapadas, igual que los antiguos `'kw' in text`.
+KEYWORD_RE = re.compile('(?=(%s))' % '|'.join(
+    re.escape(kw) for kw in sorted(KEYWORD_TAGS, key=len, reverse=True)
+))
+
+
+def keyword_tags(text):
+    """Etiquetas de todas las palabras clave presentes en ``text``"""
+    return {KEYWORD_TAGS[kw] for kw in KEYWORD_RE.findall(text)}
+
+
+def assign_ingredients_to_products(by_name):
+    """Asignar ingredientes a productos basándose en nombres y descripciones.
+
+    ``by_name`` es el dict nombre ES -> ingrediente de create_base_ingredients;
+    el bucle no hace ninguna consulta de ingredientes.
+    """
+
+    # Mapeo simple: buscar palabras clave y asignar ingredientes.
+    # Las traducciones se precargan para no consultar por producto.
+    products = Product.objects.prefetch_related('translations')
+    IngredientLink = Product.ingredients.through
+    links = []
+    updated_ids = []
 
     for product in products:
         product.set_current_language('es')
-        name = product.name.lower()
-        desc = (product.description or '').lower()
-        text = name + ' ' + desc
+        # Ninguna palabra clave tiene espacios, así que las etiquetas del
+        # texto completo son las del nombre más las de la descripción
+        name_tags = keyword_tags(product.name.lower())
+        text_tags = name_tags | keyword_tags((product.description or '').lower())
 
         assigned = []
 
         # Ingredientes base comunes
-        if 'patatas' in text or 'patatas' in name:
-            if 'Patatas' in ingredients:
-                assigned.append(ingredients['Patatas'])
-
-        if 'ensalada' in name:
-            if 'Lechuga' in ingredients:
-                assigned.append(ingredients['Lechuga'])
-            if 'Tomate cherry' in ingredients:
-                assigned.append(ingredients['Tomate cherry'])
-
-        if 'hamburguesa' in name or 'burger' in name:
-            assigned.extend([ingredients.get('Pan'), ingredients.get('Lechuga'),
-                           ingredients.get('Tomate'), ingredients.get('Cebolla'),
-                           ingredients.get('Mayonesa')])
-            if 'pollo' in text:
-                assigned.append(ingredients.get('Pollo'))
-            elif 'cerdo' in text:
-                assigned.append(ingredients.get('Cerdo'))
+        if 'patatas' in text_tags:
+            assigned.append(by_name.get('Patatas'))
+
+        if 'ensalada' in name_tags:
+            assigned.extend([by_name.get('Lechuga'), by_name.get('Tomate cherry')])
+
+        if 'burger' in name_tags:
+            assigned.extend([by_name.get('Pan'), by_name.get('Lechuga'),
+                           by_name.get('Tomate'), by_name.get('Cebolla'),
+                           by_name.get('Mayonesa')])
+            if 'pollo' in text_tags:
+                assigned.append(by_name.get('Pollo'))
+            elif 'cerdo' in text_tags:
+                assigned.append(by_name.get('Cerdo'))
             else:
-                assigned.append(ingredients.get('Ternera'))
-
-        if 'campero' in name or 'montadito' in name or 'pepito' in name or 'sandwich' in name or 'serranito' in name:
-            assigned.extend([ingredients.get('Pan'), ingredients.get('Lechuga'),
-                           ingredients.get('Tomate'), ingredients.get('Mayonesa')])
-
-            if 'pollo' in text:
-                assigned.append(ingredients.get('Pollo'))
-            if 'lomo' in text:
-                assigned.append(ingredients.get('Cerdo'))
-            if 'atún' in text:
-                assigned.append(ingredients.get('Atún'))
-            if 'serrano' in text and extras.get('Jamón serrano'):
-                assigned.append(extras['Jamón serrano'])
-            if 'bacon' in text and extras.get('Bacon'):
-                assigned.append(extras['Bacon'])
-            if 'huevo' in text and extras.get('Huevo'):
-                assigned.append(extras['Huevo'])
+                assigned.append(by_name.get('Ternera'))
+
+        if 'bocadillo' in name_tags:
+            assigned.extend([by_name.get('Pan'), by_name.get('Lechuga'),
+                           by_name.get('Tomate'), by_name.get('Mayonesa')])
+
+            if 'pollo' in text_tags:
+                assigned.append(by_name.get('Pollo'))
+            if 'lomo' in text_tags:
+                assigned.append(by_name.get('Cerdo'))
+            if 'atún' in text_tags:
+                assigned.append(by_name.get('Atún'))
+            if 'serrano' in text_tags:
+                assigned.append(by_name.get('Jamón serrano'))
+            if 'bacon' in text_tags:
+                assigned.append(by_name.get('Bacon'))
+            if 'huevo' in text_tags:
+                assigned.append(by_name.get('Huevo'))
 
         # Asignar ingredientes únicos
-        assigned = [i for i in assigned if i is not None]
+        assigned = {i.pk for i in assigned if i is not None}
         if assigned:
-            product.ingredients.set(assigned)
-            count += 1
+            updated_ids.append(product.pk)
+            links.extend(
+                IngredientLink(product_id=product.pk, ingredient_id=ing_id)
+                for ing_id in assigned
+            )
             print(f"✓ {len(assigned)} ingredientes asignados a: {product.name}")
 
-    return count
+    # Equivale a product.ingredients.set() en todos los productos a la vez
+    with transaction.atomic():
+        IngredientLink.objects.filter(product_id__in=updated_ids).delete()
+        IngredientLink.objects.bulk_create(links, ignore_conflicts=True, batch_size=1000)
+
+    return len(updated_ids)
 
 def main():
     print("=" * 60)
@@ -0,0 +1,13 @@
+"""Project-wide pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    """Hash passwords with MD5 in tests.
+
+    Production hashers (Argon2id) are deliberately slow; tests only need
+    hashes that round-trip, so this keeps user-heavy tests fast.
+    """
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
@@ -14,12 +14,12 @@ def get_or_create_ingredient(name_es, name_en, price=0):
     if existing:
         return existing
 
-    ing = Ingredient.objects.create(price=price)
-    ing.set_current_language('es')
-    ing.name = name_es
-    ing.save()
-    ing.set_current_language('en')
-    ing.name = name_en
+    # Ambas traducciones en memoria y un único save(): parler guarda todas
+    # las traducciones pendientes junto con el ingrediente
+    ing = Ingredient(price=price)
+    for lang, name in (('es', name_es), ('en', name_en)):
+        ing.set_current_language(lang)
+        ing.name = name
     ing.save()
     return ing
 